@@ -10,26 +10,53 @@ Usage:
 """
 
 import sys
-from pathlib import Path
+import os
 
 # Ensure the application directory is in the Python path
-app_dir = Path(__file__).parent
-if str(app_dir) not in sys.path:
-    sys.path.insert(0, str(app_dir))
-
-# Import and launch the GUI application
-try:
-    from gui import ModernTTKApp
-    
-    if __name__ == "__main__":
-        app = ModernTTKApp()
-        app.root.mainloop()
-        
-except ImportError as e:
-    print(f"Error: Failed to import GUI module.\n{e}")
-    print("Please ensure all dependencies are installed:")
-    print("  pip install -r requirements.txt")
-    sys.exit(1)
-except Exception as e:
-    print(f"Error: Failed to start application.\n{e}")
+# (PyInstaller already configures paths for frozen builds)
+if not getattr(sys, "frozen", False):
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    # Direct execution already puts the script dir first; only scan otherwise
+    if sys.path[:1] != [app_dir] and app_dir not in sys.path:
+        sys.path.insert(0, app_dir)
+
+
+def __getattr__(name):
+    """Resolve ModernTTKApp lazily so importing this module stays cheap."""
+    if name == "ModernTTKApp":
+        from gui import ModernTTKApp
+        return ModernTTKApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Frozen/CI builds can force the GUI import up front so missing
+# dependencies surface immediately instead of on first use
+if os.environ.get("IMZACI_EAGER_IMPORT") == "1" and __name__ != "__main__":
+    import importlib
+    importlib.import_module("gui")
+
+
+def _fail(msg, e):
+    write = sys.stderr.write
+    write("Error: " + msg + "\n" + str(e) + "\n")
+    if isinstance(e, ImportError):
+        write("Please ensure all dependencies are installed:\n")
+        write("  pip install -r requirements.txt\n")
     sys.exit(1)
+
+
+if __name__ == "__main__":
+    # Frozen builds: let batch-signing worker processes start (spawn)
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    # Import and launch the GUI application
+    try:
+        from gui import ModernTTKApp
+    except ImportError as e:
+        _fail("Failed to import GUI module.", e)
+
+    try:
+        ModernTTKApp().root.mainloop()
+    except Exception as e:
+        _fail("Failed to start application.", e)
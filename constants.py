@@ -5,8 +5,35 @@ This module centralizes all magic numbers, default values, and configuration
 constants used throughout the PDF signing application.
 """
 
+from dataclasses import dataclass, fields
+from functools import cache
 from pathlib import Path
+from typing import NamedTuple
 import os
+import sys
+
+# The lazy path constants (see __getattr__) are left out so a star import
+# doesn't resolve them all eagerly; import them by name
+__all__ = (
+    "APP_NAME", "APP_VERSION", "APP_TITLE",
+    "WINDOW_WIDTH", "WINDOW_HEIGHT", "WINDOW_THEME",
+    "SignatureSettings", "DEFAULT_SIGNATURE_SETTINGS",
+    "PLACEMENT_OPTIONS", "PLACEMENT_CODES", "PLACEMENT_CODE_IDX",
+    "PLACEMENT_LABELS", "PLACEMENT_LABEL_BY_CODE", "PLACEMENT_CODE_BY_LABEL",
+    "FONT_FAMILY", "FONT_EMOJI_FAMILY", "FONTS",
+    "TITLE_FONT_SIZE", "SUBTITLE_FONT_SIZE", "ICON_FONT_SIZE", "SMALL_FONT_SIZE",
+    "ICON_SIZE_NORMAL", "ICON_SIZE_LARGE", "ICON_SIZE_HOVER",
+    "PDF_PAGE_WIDTH_PT", "PDF_PAGE_HEIGHT_PT", "MM_TO_POINTS",
+    "IMAGE_SCALE_FACTOR", "MAX_IMAGE_WIDTH_RATIO",
+    "mm_to_pt",
+    "LOG_PANEL_HEIGHT", "LOG_ROWS", "LOG_ARCHIVE_SIZE", "LOG_FLUSH_INTERVAL",
+    "LOG_MAX_LINES", "LOG_QUEUE_POLL_INTERVAL",
+    "PKCS11_TIMEOUT", "SLOT_REFRESH_INTERVAL", "BATCH_SIGN_MAX_WORKERS",
+    "LARGE_FILE_THRESHOLD", "HUGE_FILE_THRESHOLD",
+    "PREVIEW_REFRESH_DEBOUNCE", "PREVIEW_REFRESH_DEBOUNCE_NS",
+    "SIGNATURE_SAVE_DEBOUNCE", "SIGNATURE_SAVE_DEBOUNCE_NS",
+    "loads_fast", "dumps_fast",
+)
 
 # Application metadata
 APP_NAME = "PDF İmzacı"
@@ -14,14 +41,8 @@ APP_VERSION = "2.3"
 APP_TITLE = f"{APP_NAME} v{APP_VERSION}"
 
 # Paths and directories
-HOME_DIR = Path(os.environ.get('USERPROFILE', Path.home()))
-CONFIG_DIR = HOME_DIR / '.imzaci'
-CONFIG_FILE = CONFIG_DIR / 'config.json'
-DEFAULT_DLL = Path(r"C:\Windows\System32\akisp11.dll")
-
-# Temporary directory for generated files
-import tempfile
-TEMP_DIR = Path(tempfile.gettempdir()) / 'imzaci'
+# HOME_DIR, CONFIG_DIR, CONFIG_FILE, DEFAULT_DLL and TEMP_DIR are resolved
+# lazily, see __getattr__ at the bottom
 
 # UI Geometry and Layout
 WINDOW_WIDTH = 900
@@ -29,39 +50,99 @@ WINDOW_HEIGHT = 860
 WINDOW_THEME = "flatly"  # light theme options: flatly, litera, lumen, etc.
 
 # Signature and overlay settings (persisted under 'signature' in config)
-DEFAULT_SIGNATURE_SETTINGS = {
+@dataclass(slots=True, frozen=True)
+class SignatureSettings:
+    """Immutable signature/overlay settings.
+
+    Supports read-only dict-style access (``s['width_mm']``, ``s.get(...)``)
+    for call sites that still treat the settings as a mapping.
+    """
     # NOTE: 'width_mm' is used as the signature font size (mm) in the current UI semantics
-    'width_mm': 3.0,         # font size / text size for the generated signature (mm)
-    'logo_width_mm': 15.0,   # logo image width in mm (user-requested default)
-    'margin_mm': 12.0,       # legacy single margin value (mm)
-    'margin_x_mm': 12.0,     # horizontal margin (mm)
-    'margin_y_mm': 25.0,     # vertical margin (mm)
-    'placement': 'top-right', # default placement
-    'font_family': 'Segoe',   # default font family for signature text
-    'font_style': 'Bold',     # default font style
-} 
+    width_mm: float = 4.5         # font size / text size for the generated signature (mm)
+    logo_width_mm: float = 20.0   # logo image width in mm
+    margin_x_mm: float = 12.0     # horizontal margin (mm)
+    margin_y_mm: float = 25.0     # vertical margin (mm)
+    placement: str = sys.intern('top-right')  # default placement
+    font_family: str = 'Segoe'    # default font family for signature text
+    font_style: str = 'Bold'      # default font style
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return self.__dataclass_fields__.keys()
+
+    def to_dict(self):
+        """Return a plain dict suitable for JSON serialization."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build settings from a config dict, ignoring unknown keys."""
+        if not data:
+            return cls()
+        known = cls.__dataclass_fields__
+        values = {k: v for k, v in data.items() if k in known}
+        if isinstance(values.get('placement'), str):
+            values['placement'] = sys.intern(values['placement'])
+        return cls(**values)
+
+
+DEFAULT_SIGNATURE_SETTINGS = SignatureSettings()
 
 # Signature placement options: (code, localized_label)
-PLACEMENT_OPTIONS = [
-    ('top-right', 'Sağ Üst'),
-    ('top-left', 'Sol Üst'),
-    ('bottom-right', 'Sağ Alt'),
-    ('bottom-left', 'Sol Alt'),
-    ('center', 'Orta'),
-]
+# Codes are interned so placement comparisons resolve on identity
+PLACEMENT_OPTIONS = tuple(
+    (sys.intern(code), label)
+    for code, label in (
+        ('top-right', 'Sağ Üst'),
+        ('top-left', 'Sol Üst'),
+        ('bottom-right', 'Sağ Alt'),
+        ('bottom-left', 'Sol Alt'),
+        ('center', 'Orta'),
+    )
+)
+PLACEMENT_CODES = frozenset(code for code, _ in PLACEMENT_OPTIONS)
+# Placement code -> small int, in PLACEMENT_OPTIONS order (0 = top-right)
+PLACEMENT_CODE_IDX = {code: i for i, (code, _) in enumerate(PLACEMENT_OPTIONS)}
+# Combobox values and code <-> label lookups
+PLACEMENT_LABELS = tuple(label for _, label in PLACEMENT_OPTIONS)
+PLACEMENT_LABEL_BY_CODE = dict(PLACEMENT_OPTIONS)
+PLACEMENT_CODE_BY_LABEL = {label: code for code, label in PLACEMENT_OPTIONS}
 
 # Font configuration
 FONT_FAMILY = "Segoe UI"
 FONT_EMOJI_FAMILY = "Segoe UI Emoji"
-TITLE_FONT_SIZE = 20
-SUBTITLE_FONT_SIZE = 10
-ICON_FONT_SIZE = 12
-SMALL_FONT_SIZE = 8
 
-# Icon configuration
-ICON_SIZE_NORMAL = 18
-ICON_SIZE_LARGE = 28
-ICON_SIZE_HOVER = 30
+
+class _Fonts(NamedTuple):
+    """Font and icon sizes used across the UI."""
+    title: int = 20
+    subtitle: int = 10
+    icon: int = 12
+    small: int = 8
+    # Icon configuration
+    icon_normal: int = 18
+    icon_large: int = 28
+    icon_hover: int = 30
+
+
+FONTS = _Fonts()
+
+# Back-compat aliases
+TITLE_FONT_SIZE = FONTS.title
+SUBTITLE_FONT_SIZE = FONTS.subtitle
+ICON_FONT_SIZE = FONTS.icon
+SMALL_FONT_SIZE = FONTS.small
+ICON_SIZE_NORMAL = FONTS.icon_normal
+ICON_SIZE_LARGE = FONTS.icon_large
+ICON_SIZE_HOVER = FONTS.icon_hover
 
 # PDF rendering
 PDF_PAGE_WIDTH_PT = 595.0   # A4 width in points
@@ -70,17 +151,104 @@ MM_TO_POINTS = 72.0 / 25.4  # conversion factor: millimeters to points
 IMAGE_SCALE_FACTOR = 0.8
 MAX_IMAGE_WIDTH_RATIO = 0.2  # max 20% of page width
 
+
+def mm_to_pt(mm):
+    """Convert millimeters to PDF points."""
+    return float(mm) * MM_TO_POINTS
+
 # Logging and output
 LOG_PANEL_HEIGHT = 85  # pixels for log output
 LOG_ROWS = 7
+LOG_ARCHIVE_SIZE = 5000  # messages kept in memory (oldest dropped first)
+LOG_FLUSH_INTERVAL = 33  # milliseconds between batched log widget inserts
+LOG_MAX_LINES = 2000  # lines kept in the log widget (full history is in the archive)
+LOG_QUEUE_POLL_INTERVAL = 50  # milliseconds between drains of worker-thread log messages
 
 # PKCS#11 parameters
 PKCS11_TIMEOUT = 30  # seconds
 SLOT_REFRESH_INTERVAL = 5000  # milliseconds
+BATCH_SIGN_MAX_WORKERS = 4  # parallel files in batch signing (token signatures stay serialized)
 
 # File size thresholds
-LARGE_FILE_THRESHOLD = 10 * 1024 * 1024  # 10 MB (for PDF compression decisions)
+LARGE_FILE_THRESHOLD = 10 << 20  # 10 MiB (for PDF compression decisions)
+HUGE_FILE_THRESHOLD = 50 << 20   # 50 MiB (reserved for future use)
 
 # Debounce timings
-PREVIEW_REFRESH_DEBOUNCE = 200  # milliseconds
-SIGNATURE_SAVE_DEBOUNCE = 500   # milliseconds
+PREVIEW_REFRESH_DEBOUNCE = 200  # milliseconds (for after())
+PREVIEW_REFRESH_DEBOUNCE_NS = PREVIEW_REFRESH_DEBOUNCE * 1_000_000
+SIGNATURE_SAVE_DEBOUNCE = 750   # milliseconds
+SIGNATURE_SAVE_DEBOUNCE_NS = SIGNATURE_SAVE_DEBOUNCE * 1_000_000
+
+# Config (de)serialization: orjson when available, stdlib json otherwise.
+# dumps_fast always returns UTF-8 bytes indented by two spaces.
+try:
+    import orjson
+
+    loads_fast = orjson.loads
+
+    def dumps_fast(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    loads_fast = json.loads
+
+    def dumps_fast(data):
+        return json.dumps(data, indent=2).encode('utf-8')
+
+
+@cache
+def _home_dir():
+    """Return the user's home directory (USERPROFILE first on Windows)."""
+    if sys.platform == "win32":
+        home = os.environ.get('USERPROFILE') or os.path.expanduser('~')
+    else:
+        home = os.path.expanduser('~')
+    return Path(home)
+
+
+@cache
+def _default_dll():
+    """Locate the AKIS PKCS#11 module, falling back to the System32 path.
+
+    find_library searches PATH on Windows, which also covers WOW64 setups
+    where the hard-coded System32 path is redirected.
+    """
+    if sys.platform == "win32":
+        import ctypes.util
+        found = ctypes.util.find_library("akisp11")
+        if found:
+            return Path(found)
+    return Path(r"C:\Windows\System32\akisp11.dll")
+
+
+_LAZY_NAMES = ("HOME_DIR", "CONFIG_DIR", "CONFIG_FILE", "DEFAULT_DLL", "TEMP_DIR")
+
+
+def __dir__():
+    """List the lazy path constants alongside the module globals."""
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+
+def __getattr__(name):
+    """Lazily resolve path constants (PEP 562).
+
+    The value is cached in the module globals on first access so later
+    lookups bypass this hook entirely.
+    """
+    if name == "HOME_DIR":
+        value = _home_dir()
+    elif name == "CONFIG_DIR":
+        value = _home_dir() / '.imzaci'
+    elif name == "CONFIG_FILE":
+        value = _home_dir() / '.imzaci' / 'config.json'
+    elif name == "TEMP_DIR":
+        # Temporary directory for generated files
+        import tempfile
+        value = Path(tempfile.gettempdir()) / 'imzaci'
+    elif name == "DEFAULT_DLL":
+        value = _default_dll()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
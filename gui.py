@@ -20,29 +20,55 @@ try:
 except ImportError:
     TBIcon = None
 from pathlib import Path
+import tkinter as tk
 from tkinter import filedialog, messagebox, Toplevel, Label, Text
 import threading
+import queue
+import re
+from typing import NamedTuple
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import os
+import stat
+import time
+from functools import lru_cache
 import webbrowser
 import math
-try:
-    from PIL import Image as PILImage, ImageTk
-except ImportError:
-    PILImage = None
-try:
-    import fitz  # PyMuPDF
-except ImportError:
-    fitz = None
-try:
-    import fitz  # type: ignore
-except ImportError:
-    fitz = None
+
+# Pillow and PyMuPDF are imported on first use (preview/template paths only)
+_PIL = None
+_fitz = None
+
+
+def _get_pil():
+    """Return (PIL.Image, PIL.ImageTk), or (None, None) if Pillow is missing."""
+    global _PIL
+    if _PIL is None:
+        try:
+            from PIL import Image, ImageTk
+            _PIL = (Image, ImageTk)
+        except ImportError:
+            _PIL = (None, None)
+    return _PIL
+
+
+def _get_fitz():
+    """Return the PyMuPDF module, or None if it is not installed."""
+    global _fitz
+    if _fitz is None:
+        try:
+            import fitz  # PyMuPDF
+            _fitz = fitz
+        except ImportError:
+            _fitz = False
+    return _fitz or None
+
+
+# Rendered icons shared across BootstrapIcon instances: (name, color, size) -> image
+_ICON_CACHE = {}
 
 # Import from sign_pdf backend
 from sign_pdf import (
-    DEFAULT_DLL,
-    DEFAULT_SIGNATURE_SETTINGS,
-    PLACEMENT_OPTIONS,
     TEMP_DIR,
     cleanup_temp_cache,
     resource_path,
@@ -51,19 +77,177 @@ from sign_pdf import (
     find_pkcs11_candidates,
     is_pkcs11_provider,
     load_pkcs11_lib,
+    cached_pkcs11_lib,
     has_tokens_in_pkcs11_lib,
     list_certs,
     sign_cmd,
+    sign_many,
     create_combined_signature_image
 )
 
 # Import centralized constants
 from constants import (
-    APP_NAME, APP_VERSION, WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_THEME,
-    DEFAULT_SIGNATURE_SETTINGS, PLACEMENT_OPTIONS,
-    FONT_FAMILY, FONT_EMOJI_FAMILY, TITLE_FONT_SIZE, ICON_FONT_SIZE,
-    ICON_SIZE_NORMAL, ICON_SIZE_LARGE, ICON_SIZE_HOVER
+    APP_NAME, APP_VERSION, WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_THEME, CONFIG_DIR,
+    DEFAULT_SIGNATURE_SETTINGS, SignatureSettings,
+    PLACEMENT_LABELS, PLACEMENT_LABEL_BY_CODE, PLACEMENT_CODE_BY_LABEL,
+    FONT_FAMILY, FONT_EMOJI_FAMILY, FONTS,
+    LOG_ARCHIVE_SIZE, LOG_FLUSH_INTERVAL, LOG_MAX_LINES, LOG_QUEUE_POLL_INTERVAL,
+    BATCH_SIGN_MAX_WORKERS,
+    PREVIEW_REFRESH_DEBOUNCE_NS, SIGNATURE_SAVE_DEBOUNCE_NS
+)
+
+# Header fonts
+_ICON_FONT = (FONT_EMOJI_FAMILY, FONTS.icon)
+_TITLE_FONT = (FONT_FAMILY, FONTS.title, "bold")
+_SUBTITLE_FONT = (FONT_FAMILY, FONTS.subtitle)
+
+# Log filter: matcher number -> substring identifying the message
+_LOG_MATCHERS = {
+    1: 'Numpad imzalama hatası',
+    2: "PKCS#11 DLL seçiliyor",
+    3: 'Seçildi:',
+    4: 'Seçilen DLL içinde token aranıyor',
+    5: '⚠️ Hata:',
+    6: 'Token bulundu',
+    7: 'Token bulunamadı',
+    10: 'Tarama hatası',
+    11: 'Tarama tamamlandı:',
+    12: 'Auto-selected',
+    14: '📂 Giriş',
+    15: '➕ Önerilen çıkış',
+    16: '📂 Çıkış',
+    19: 'Token ve sertifika bulundu',
+    20: 'Token bulunamadı',
+    21: 'İmzalama işlemi başlatılıyor',
+    22: '⚠️ Hata:',
+    24: 'DLL yüklenemedi',
+    25: 'Token listesi hatası',
+    26: 'Token listesi okunamadı',
+    27: 'DLL yüklenemedi',
+    28: 'Slot arama hatası',
+    29: 'Seçilen token bulunamadı',
+    30: 'Sertifika okuma hatası',
+    31: 'Sertifika okunamadı',
+    32: 'İmza ayarları kaydedildi',
+    33: 'İmza ayarları kaydedilemedi',
+    34: 'İmza ayarları sıfırlandı',
+    35: 'Sıfırlama başarısız',
+    37: 'Geçersiz imza ayar değeri',
+    39: 'İmza resmi okunurken hata',
+    41: 'İmza ayarları kaydedilemedi',
+    42: 'İptal isteği gönderildi',
+    43: 'Token listesi yenilendi',
+}
+# Matcher numbers shown in the log panel by default
+_LOG_ENABLED_DEFAULT = frozenset({1,2,3,4,5,6,7,10,11,12,14,15,16,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,37,39,41,42,43})
+
+# Signature font choices -> family shown in the info label
+_SIG_INFO_FONT_FAMILIES = {
+    'Segoe': 'Segoe UI',
+    'Arial': 'Arial',
+    'Times': 'Times New Roman',
+    'Verdana': 'Verdana',
+    'Tahoma': 'Tahoma',
+    'Courier': 'Courier New',
+}
+
+
+@lru_cache(maxsize=64)
+def _make_font(family, size, weight):
+    """Return a shared tkinter Font for (family, size, weight)."""
+    return tk.font.Font(family=family, size=size, weight=weight)
+
+
+@lru_cache(maxsize=4)
+def _resolve_logo_path(custom_path):
+    """Custom signature image path if it exists, else the bundled logo.
+
+    Memoized per configured path so preview redraws don't stat() the file
+    each time; cleared when a new image is chosen.
+    """
+    if custom_path:
+        path = Path(custom_path)
+        if path.exists():
+            return path
+    return resource_path('logo_imza.png')
+
+
+# Pixels per mm in the preview window (the largest preview drawn)
+_PREVIEW_WIN_SCALE = 2.5
+
+# Concurrent subprocess token probes during the PKCS#11 auto-scan
+_PKCS11_PROBE_WORKERS = 4
+
+# Signature control change flags, coalesced by _mark_sig_dirty
+_SIG_DIRTY_FONT = 1
+_SIG_DIRTY_GEOM = 2
+_SIG_DIRTY_PLACEMENT = 4
+_SIG_DIRTY_MARGIN = 8
+# Minimum height (px) of the signature's drag target on the preview canvas
+_SIG_MIN_HIT_PX = 8
+# Delay before coalesced signature-control changes are applied (~one frame)
+_SIG_REFRESH_DELAY_MS = 16
+
+# DocMDP (certification permissions): (display label, sign_pdf mode)
+_DOCMDP_OPTIONS = (
+    ("Sadece imza", "signing_only"),
+    ("Form doldurma + imza", "form_fill"),
+    ("Form + yorum + imza", "annotations"),
 )
+_DOCMDP_MAP = dict(_DOCMDP_OPTIONS)
+_DOCMDP_REV = {mode: label for label, mode in _DOCMDP_OPTIONS}
+_DOCMDP_LABELS = tuple(label for label, _ in _DOCMDP_OPTIONS)
+
+# CN value in an RFC 4514 subject string (escaped commas stay inside the value)
+_CN_RE = re.compile(r'(?:^|,)\s*CN=((?:[^,\\]|\\.)+)', re.IGNORECASE)
+_RDN_UNESCAPE_RE = re.compile(r'\\(.)')
+
+
+def _subject_cn(subject):
+    """Return the CN from an RFC 4514 subject string, or None if it has none.
+
+    Hex-encoded values (CN=#04...) are returned as-is.
+    """
+    m = _CN_RE.search(subject)
+    if m is None:
+        return None
+    return _RDN_UNESCAPE_RE.sub(r'\1', m.group(1).strip())
+
+
+def _dialog_initial_dir(*paths):
+    """Return the folder of the first existing path (itself if a directory), else CWD.
+
+    One os.stat per candidate instead of separate exists/is_dir checks.
+    """
+    for p in paths:
+        if not p:
+            continue
+        try:
+            st = os.stat(p)
+        except OSError:
+            continue
+        return p if stat.S_ISDIR(st.st_mode) else os.path.dirname(p)
+    return str(Path.cwd())
+
+
+class _CertInfo(NamedTuple):
+    """One certificate entry of `_cert_map` (display name -> _CertInfo).
+
+    A tuple per certificate instead of a dict; get()/items() keep the
+    mapping-style reads of the existing call sites working.
+    """
+    slot_id: int
+    token_label: str
+    cert_label: str
+    subject: str
+    issuer: str
+    serial: int
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def items(self):
+        return zip(self._fields, self)
 
 
 class BootstrapIcon:
@@ -78,7 +262,21 @@ class BootstrapIcon:
         fallback_char (str): Fallback emoji/char if icon fails to load.
     """
     
-    def __init__(self, name: str, fallback_char: str = "", states: list | None = None, size: int = 18):
+    # Bootstyle color name -> hex, resolved once from the active theme
+    _color_map = None
+
+    @classmethod
+    def resolve_colors(cls) -> dict:
+        """Return (and cache) the theme's bootstyle color table."""
+        if cls._color_map is None:
+            try:
+                colors = ttk.Style().colors
+                cls._color_map = {c: colors.get(c) for c in colors}
+            except Exception:
+                return {}
+        return cls._color_map
+
+    def __init__(self, name: str, fallback_char: str = "", states: list | None = None, size: int = 18, color_map: dict | None = None):
         """Initialize icon manager.
         
         Args:
@@ -86,6 +284,7 @@ class BootstrapIcon:
             fallback_char (str): Fallback character if icon loading fails.
             states (list): List of state configs (normal, hover). Default uses secondary/primary colors.
             size (int): Icon size in pixels. Default 18.
+            color_map (dict): Resolved bootstyle colors. Default uses resolve_colors().
         """
         self.images = {}
         self.widget = None
@@ -101,7 +300,8 @@ class BootstrapIcon:
         if not states:
             states = ({"name": name, "color": "secondary"}, {"name": name, "color": "primary"})
         
-        style = ttk.Style()
+        if color_map is None:
+            color_map = self.resolve_colors()
         for i, state_name in enumerate(['normal', 'hover']):
             if i < len(states):
                 cfg = states[i]
@@ -109,11 +309,16 @@ class BootstrapIcon:
                 # Duruma özel boyut varsa onu kullan, yoksa varsayılanı kullan
                 s = cfg.get('size', size)
                 # Resolve bootstyle color name to hex code if possible
-                color_val = style.colors.get(c) if hasattr(style, 'colors') and c in style.colors else c
+                color_val = color_map.get(c, c)
                 icon_name = cfg.get('name', name)
                 try:
-                    # Use keyword arguments to avoid positional argument errors (str vs int)
-                    img = TBIcon(name=icon_name, color=color_val, size=s)
+                    # Same glyph/color/size renders once and is shared between widgets
+                    key = (icon_name, color_val, s)
+                    img = _ICON_CACHE.get(key)
+                    if img is None:
+                        # Use keyword arguments to avoid positional argument errors (str vs int)
+                        img = TBIcon(name=icon_name, color=color_val, size=s)
+                        _ICON_CACHE[key] = img
                     self.images[state_name] = img
                 except Exception:
                     pass
@@ -155,6 +360,13 @@ class BootstrapIcon:
 
 class CreateToolTip:
     """Create a tooltip for a given widget that recalculates position on show (multi-screen safe)."""
+    _style_initialized = False
+    # One hidden Toplevel/Label pair shared by every tooltip
+    _tip_window = None
+    _tip_label = None
+    # Measured tooltip width per text, so only the first show forces a layout pass
+    _width_cache = {}
+
     def __init__(self, widget, text, root_window=None):
         self.widget = widget
         self.text = text
@@ -162,6 +374,13 @@ class CreateToolTip:
         self.tipwindow = None
         self.id = None
         self.x = self.y = 0
+        # Register the tooltip style once, not on every hover
+        if not CreateToolTip._style_initialized:
+            try:
+                ttk.Style().configure("Tooltip.TLabel", background="#FFA500", foreground="white", padding=(4, 2))
+                CreateToolTip._style_initialized = True
+            except Exception:
+                pass
         # Bind events directly to show/hide tooltip
         self.widget.bind("<Enter>", self.showtip, add="+")
         self.widget.bind("<Leave>", self.hidetip, add="+")
@@ -178,21 +397,28 @@ class CreateToolTip:
             x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
             y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
             
-            # Create tooltip window - use main root for multi-screen support
-            self.tipwindow = tw = Toplevel(self.root)
-            tw.wm_overrideredirect(True)
-            tw.attributes('-topmost', True)  # Ensure tooltip stays on top
+            # Create the shared tooltip window once - use main root for multi-screen support
+            tw = CreateToolTip._tip_window
+            if tw is None or not tw.winfo_exists():
+                tw = Toplevel(self.root)
+                tw.withdraw()
+                tw.wm_overrideredirect(True)
+                tw.attributes('-topmost', True)  # Ensure tooltip stays on top
+                # Light orange background with white text
+                label = ttk.Label(tw, style="Tooltip.TLabel")
+                label.pack(ipadx=2, ipady=2)
+                CreateToolTip._tip_window = tw
+                CreateToolTip._tip_label = label
+            CreateToolTip._tip_label.configure(text=self.text)
+            self.tipwindow = tw
             
-            # Create label with text - light orange background with white text
-            style = ttk.Style()
-            style.configure("Tooltip.TLabel", background="#FFA500", foreground="white", padding=(4, 2))
-            label = ttk.Label(tw, text=self.text, style="Tooltip.TLabel")
-            label.pack(ipadx=2, ipady=2)
-            
-            # Position tooltip - offset to center horizontally
-            tw.update_idletasks()
-            tw_width = tw.winfo_width()
+            # Position tooltip - offset to center horizontally, then show it
+            tw_width = CreateToolTip._width_cache.get(self.text)
+            if tw_width is None:
+                tw.update_idletasks()
+                tw_width = CreateToolTip._width_cache[self.text] = tw.winfo_reqwidth()
             tw.wm_geometry(f"+{max(0, x - tw_width // 2)}+{y}")
+            tw.deiconify()
         except Exception:
             self.tipwindow = None
     
@@ -200,7 +426,7 @@ class CreateToolTip:
         """Hide tooltip."""
         if self.tipwindow:
             try:
-                self.tipwindow.destroy()
+                self.tipwindow.withdraw()
             except Exception:
                 pass
             self.tipwindow = None
@@ -217,14 +443,41 @@ class ModernTTKApp:
     
     def __init__(self):
         """Initialize the application and set up the UI."""
-        # Clean up ALL temporary files before starting (fixes stale DPI/coordinate issues)
-        cleanup_temp_cache()
-        
+        # Log state (log_message may run before the log widget exists)
+        self.log_text = None
+        self._log_archive = deque(maxlen=LOG_ARCHIVE_SIZE)
+        self._log_filter_re = None
+        # Log lines waiting for the next batched insert (see _flush_log)
+        self._log_pending = []
+        self._log_flush_scheduled = False
+        # Log messages and UI callables from worker threads, drained on the
+        # Tk thread (see _drain_ui_queue)
+        self._ui_queue = queue.SimpleQueue()
+        self._main_thread_id = threading.get_ident()
+
         # Initialize image cache variables (clear any stale caches)
-        self._sig_image_cache = None
-        self._sig_image_cache_key = None
-        self._bg_image_cache = None
-        self._bg_image_cache_key = None
+        # Bounded LRU of decoded/resized PIL images and PhotoImages, see _cached_image
+        self._image_cache = OrderedDict()
+        # (path, mtime) of the image shown in the template panel thumbnail
+        self._sig_thumb_key = None
+        # Off-thread signature image builds (see _build_sig_image_async)
+        self._sig_build_key = None
+        self._sig_build_gen = 0
+        self._sig_build_pending = False
+        # Render key of the image last written to gui_preview_sig.png
+        self._sig_png_key = None
+        # (resolved path, mtime) of the PDF last rendered into dynamic_sablon.png
+        self._dynamic_sablon_src = None
+        # Template render coalescing (see _request_template)
+        self._template_lock = threading.Lock()
+        self._template_busy = False
+        self._template_pending = None
+        # Token refresh coalescing, same scheme (see _update_tokens_internal)
+        self._token_lock = threading.Lock()
+        self._token_busy = False
+        self._token_pending = None
+        # canvas -> (layer key, anchor rect id, background key) of the last full preview draw
+        self._canvas_layers = {}
         self._embedded_bg_photo = None
         self._preview_bg_photo = None
         self._embedded_sig_photo = None
@@ -235,6 +488,15 @@ class ModernTTKApp:
         self.root.title(APP_NAME)
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.resizable(True, True)
+        # Resolve theme colors once for every icon built below
+        BootstrapIcon.resolve_colors()
+
+        # Clean up ALL temporary files before starting (fixes stale DPI/coordinate issues).
+        # Runs in the background so the window is not held back by disk I/O;
+        # template renders wait on _cleanup_done, and preview files written
+        # before it finished are rewritten afterwards (_after_startup_cleanup).
+        self._cleanup_done = threading.Event()
+        threading.Thread(target=self._cleanup_startup_io, daemon=True).start()
         
         # Load persisted configuration
         try:
@@ -242,20 +504,21 @@ class ModernTTKApp:
         except Exception:
             self.config = {}
         
-        # Eski dinamik şablonu temizle (Açılışta orijinal şablonun görünmesi için)
-        try:
-            dynamic_path = TEMP_DIR / 'dynamic_sablon.png'
-            if dynamic_path.exists():
-                dynamic_path.unlink()
-        except Exception:
-            pass
-
         # Drag-drop state variables
         self._is_dragging = False
         self._drag_start_x = 0
         self._drag_start_y = 0
         self._drag_logo_x = 0
         self._drag_logo_y = 0
+        self._drag_last_ns = 0
+
+        # Trailing-edge debounce state: key -> [deadline_ns, callback, after_id]
+        self._debounce_state = {}
+        # Pending signature control changes (_SIG_DIRTY_* flags)
+        self._sig_dirty = 0
+        self._sig_refresh_pending = False
+        # Inputs of the last preview drawn (see _preview_input_key)
+        self._preview_drawn_key = None
 
         self.build_ui()
         
@@ -286,19 +549,62 @@ class ModernTTKApp:
         # Auto-run PKCS#11 scan once after the GUI is idle (avoid layout races)
         self._pkcs11_scanning = False
         self.root.after_idle(self.browse_pkcs11_auto)
-        # Check internet for LTV and TSA
+        # Shared notification window and its pending hide, see _show_notification
+        self._notif = None
+        self._notif_label = None
+        self._notif_after_id = None
+        # (slot id, token serial) -> [(label, subject, issuer, serial)], see _update_tokens_internal
+        self._cert_enum_cache = {}
+        # directory -> (mtime_ns, pdf names), see _list_pdf_names
+        self._pdf_list_cache = {}
+        # Single-flight worker guards, see _spawn_once
+        self._spawn_lock = threading.Lock()
+        self._busy_events = {}
+        # Check internet for LTV and TSA (a single shared probe)
+        self._online_future = Future()
+        threading.Thread(target=self._probe_internet, daemon=True).start()
         threading.Thread(target=self._auto_enable_ltv_if_online, daemon=True).start()
         threading.Thread(target=self._auto_enable_tsa_if_online, daemon=True).start()
         
-        # İlk önizleme çizimini tetikle
-        self.root.after(1000, lambda: self._show_signature_preview(silent=True))
-        # Debounce handle for preview auto-refresh (ms timer id)
-        self._preview_refresh_after_id = None
-        # Debounce handle for signature auto-save
-        self._save_sig_after_id = None
+        # İlk önizleme çizimini tetikle (ağır kısımlar arka planda hazırlanır)
+        self.root.after(1000, self._prerender_preview_async)
+        # Load Pillow/PyMuPDF in the background so the first preview or PDF
+        # selection does not pay for the import on the Tk thread
+        threading.Thread(target=self._warm_imports, daemon=True).start()
         # Tooltip for canvas
         self.canvas_tooltip = None
 
+    def _warm_imports(self):
+        """Import the lazily loaded imaging modules (worker thread)."""
+        try:
+            _get_pil()
+            _get_fitz()
+        except Exception:
+            pass
+
+    def _cleanup_startup_io(self):
+        """Remove stale temp files left by a previous run (worker thread)."""
+        try:
+            cleanup_temp_cache()
+            # Eski dinamik şablonu temizle (Açılışta orijinal şablonun görünmesi için)
+            try:
+                dynamic_path = TEMP_DIR / 'dynamic_sablon.png'
+                if dynamic_path.exists():
+                    dynamic_path.unlink()
+            except Exception:
+                pass
+        finally:
+            self._cleanup_done.set()
+            self._ui_queue.put(self._after_startup_cleanup)
+
+    def _after_startup_cleanup(self):
+        """Forget temp files the cleanup may have deleted and redraw (Tk thread)."""
+        self._sig_png_key = None
+        self._dynamic_sablon_src = None
+        self._preview_drawn_key = None
+        self._on_pdf_preview_toggle()
+        self._auto_refresh_preview()
+
     def _check_internet_connection(self):
         """Basit bir DNS sorgusu ile internet bağlantısını kontrol eder."""
         try:
@@ -311,27 +617,53 @@ class ModernTTKApp:
         except OSError:
             return False
 
+    def _probe_internet(self):
+        """Run the connectivity check once and publish it to _online_future."""
+        try:
+            self._online_future.set_result(self._check_internet_connection())
+        except Exception:
+            self._online_future.set_result(False)
+
+    def _is_online(self):
+        """Shared (memoized) result of the startup connectivity probe."""
+        try:
+            return self._online_future.result(timeout=2.5)
+        except Exception:
+            return False
+
     def _auto_enable_ltv_if_online(self):
         """İnternet varsa LTV'yi otomatik açar, yoksa kapatır."""
-        if self._check_internet_connection():
+        if self._is_online():
             # Internet available -> Enable LTV
-            self.root.after(0, lambda: self.ltv_var.set(True))
-            self.root.after(0, lambda: self.log_message("🌐 İnternet algılandı: LTV otomatik açıldı."))
+            self._ui_queue.put(lambda: self._set_signing_var_quietly(self.ltv_var, '_ltv_trace', True))
+            self._ui_queue.put("🌐 İnternet algılandı: LTV otomatik açıldı.")
         else:
             # No internet -> Disable LTV to avoid timeouts
-            self.root.after(0, lambda: self.ltv_var.set(False))
-            self.root.after(0, lambda: self.log_message("⚠️ İnternet yok: LTV kapatıldı."))
+            self._ui_queue.put(lambda: self._set_signing_var_quietly(self.ltv_var, '_ltv_trace', False))
+            self._ui_queue.put("⚠️ İnternet yok: LTV kapatıldı.")
 
     def _auto_enable_tsa_if_online(self):
         """İnternet varsa TSA'yı otomatik açar, yoksa kapatır."""
-        if self._check_internet_connection():
+        if self._is_online():
             # Internet available -> Enable TSA
-            self.root.after(0, lambda: self.tsa_enabled_var.set(True))
-            self.root.after(0, lambda: self.log_message("🌐 İnternet algılandı: TSA otomatik açıldı."))
+            self._ui_queue.put(lambda: self._set_signing_var_quietly(self.tsa_enabled_var, '_tsa_trace', True))
+            self._ui_queue.put("🌐 İnternet algılandı: TSA otomatik açıldı.")
         else:
             # No internet -> Disable TSA to avoid timeouts
-            self.root.after(0, lambda: self.tsa_enabled_var.set(False))
-            self.root.after(0, lambda: self.log_message("⚠️ İnternet yok: TSA kapatıldı."))
+            self._ui_queue.put(lambda: self._set_signing_var_quietly(self.tsa_enabled_var, '_tsa_trace', False))
+            self._ui_queue.put("⚠️ İnternet yok: TSA kapatıldı.")
+
+    def _set_signing_var_quietly(self, var, trace_attr, value):
+        """Set an LTV/TSA variable with its save trace suspended, then schedule one save."""
+        trace_id = getattr(self, trace_attr, None)
+        try:
+            if trace_id:
+                var.trace_remove('write', trace_id)
+            var.set(value)
+        finally:
+            if trace_id:
+                setattr(self, trace_attr, var.trace_add('write', self._on_signing_option_write))
+        self._schedule_save_signing_settings()
 
     def build_ui(self):
         # Main container - use GRID for entire layout (no pack/grid mix)
@@ -350,14 +682,9 @@ class ModernTTKApp:
         self.main_frame = main_frame
         
         # Initialize fonts from constants
-        try:
-            self._icon_font = (FONT_EMOJI_FAMILY, ICON_FONT_SIZE)
-            self._title_font = (FONT_FAMILY, TITLE_FONT_SIZE, "bold")
-            self._subtitle_font = (FONT_FAMILY, 10)
-        except Exception:
-            self._icon_font = ("Segoe UI Emoji", 12)
-            self._title_font = ("Segoe UI", 20, "bold")
-            self._subtitle_font = ("Segoe UI", 10)
+        self._icon_font = _ICON_FONT
+        self._title_font = _TITLE_FONT
+        self._subtitle_font = _SUBTITLE_FONT
         
         # ===== HEADER =====
         header = ttk.Frame(main_frame, bootstyle="primary", padding=10)
@@ -479,9 +806,6 @@ class ModernTTKApp:
         self.embedded_canvas.bind('<Button-1>', self._on_canvas_click)
         self.embedded_canvas.bind('<B1-Motion>', self._on_canvas_drag)
         self.embedded_canvas.bind('<ButtonRelease-1>', self._on_canvas_release)
-
-        self.embedded_canvas.bind('<B1-Motion>', self._on_canvas_drag)
-        self.embedded_canvas.bind('<ButtonRelease-1>', self._on_canvas_release)
         
         # PKCS11 Section
         self.create_labeled_frame(config_tab, "🔐 PKCS#11 Modülü", 0)
@@ -491,7 +815,6 @@ class ModernTTKApp:
         pkcs11_frame.grid(row=1, column=0, columnspan=3, sticky=EW, pady=2, padx=4)
         pkcs11_frame.columnconfigure(0, weight=0, minsize=70)
         pkcs11_frame.columnconfigure(1, weight=1)
-        pkcs11_frame.columnconfigure(2, weight=0)
         
         ttk.Label(pkcs11_frame, text="DLL Yolu:").grid(row=0, column=0, sticky=W, padx=2, pady=2)
         self.pkcs11_var = ttk.StringVar()
@@ -529,17 +852,10 @@ class ModernTTKApp:
         token_frame.grid(row=3, column=0, columnspan=3, sticky=EW, pady=2, padx=4)
         token_frame.columnconfigure(0, weight=0, minsize=70)
         token_frame.columnconfigure(1, weight=1)
-        token_frame.columnconfigure(2, weight=0)
         
         ttk.Label(token_frame, text="Token:").grid(row=0, column=0, sticky=W, padx=2, pady=2)
         self._slot_map = {}
         self._token_combo_var = ttk.StringVar(value='(none)')
-        from ttkbootstrap import Combobox
-        # ensure Combobox is available at module level for static analyzers
-        try:
-            globals()['Combobox'] = Combobox
-        except Exception:
-            pass
         self.token_combo = Combobox(token_frame, textvariable=self._token_combo_var, values=['(none)'], state='readonly')
         self.token_combo.grid(row=0, column=1, sticky=EW, padx=2, pady=2)
         self.token_combo.bind('<<ComboboxSelected>>', lambda e: threading.Thread(target=self._on_token_change, args=(self._token_combo_var.get(),), daemon=True).start())
@@ -551,7 +867,7 @@ class ModernTTKApp:
             image=self.refresh_icon.image,
             bootstyle="warning-outline",
             padding=0,
-            command=lambda: threading.Thread(target=self._update_tokens_internal, daemon=True).start()
+            command=lambda: self._update_tokens_internal(force=True)
         )
         self.refresh_icon.attach(_btn_token_refresh)
         _btn_token_refresh.grid(row=0, column=2, sticky=W, padx=2, pady=2)
@@ -587,7 +903,6 @@ class ModernTTKApp:
         options_frame = ttk.Frame(self.sign_tab)
         options_frame.grid(row=6, column=0, columnspan=3, sticky=EW, pady=5, padx=5)
         
-        import tkinter as tk # Ensure tk is imported for BooleanVar
         signing_conf = self.config.get('signing', {}) if getattr(self, 'config', None) else {}
         self.default_tsa_url = "http://timestamp.digicert.com"
         
@@ -603,22 +918,22 @@ class ModernTTKApp:
 
         # TSA (Timestamp Authority) Toggle
         self.tsa_enabled_var = tk.BooleanVar(value=bool(signing_conf.get('tsa_enabled', False)))
-        self.tsa_check = ttk.Checkbutton(options_frame, text="TSA", variable=self.tsa_enabled_var, command=lambda: self._save_signing_settings())
+        self.tsa_check = ttk.Checkbutton(options_frame, text="TSA", variable=self.tsa_enabled_var)
         self.tsa_check.pack(side="left", padx=5)
 
+        # PDF preview template toggle (renders page 1 of the selected PDF)
+        self.pdf_preview_var = tk.BooleanVar(value=bool(signing_conf.get('pdf_preview', True)))
+        self.pdf_preview_check = ttk.Checkbutton(options_frame, text="Önizleme", variable=self.pdf_preview_var, command=self._on_pdf_preview_toggle)
+        self.pdf_preview_check.pack(side="left", padx=5)
+        CreateToolTip(self.pdf_preview_check, "PDF önizleme oluştur", self.root)
+
         # DocMDP (certification permissions)
         ttk.Label(options_frame, text="MDP:").pack(side="left")
-        self._docmdp_map = {
-            "Sadece imza": "signing_only",
-            "Form doldurma + imza": "form_fill",
-            "Form + yorum + imza": "annotations",
-        }
-        docmdp_rev = {v: k for k, v in self._docmdp_map.items()}
-        default_docmdp = docmdp_rev.get(signing_conf.get('docmdp_mode'), "Sadece imza")
+        self._docmdp_map = _DOCMDP_MAP
+        default_docmdp = _DOCMDP_REV.get(signing_conf.get('docmdp_mode'), _DOCMDP_LABELS[0])
         self.docmdp_var = tk.StringVar(value=default_docmdp)
-        self.docmdp_combo = Combobox(options_frame, textvariable=self.docmdp_var, values=list(self._docmdp_map.keys()), state='readonly', width=18)
+        self.docmdp_combo = Combobox(options_frame, textvariable=self.docmdp_var, values=_DOCMDP_LABELS, state='readonly', width=18)
         self.docmdp_combo.pack(side="left", padx=(4, 0))
-        self.docmdp_combo.bind('<<ComboboxSelected>>', lambda e: self._save_signing_settings())
         
         # Help button with icon (far right) - TTK solid light button
         _btn_signing_help = ttk.Button(
@@ -633,17 +948,22 @@ class ModernTTKApp:
         self.help_icon.attach(_btn_signing_help)
         CreateToolTip(_btn_signing_help, "İmzalama seçenekleri hakkında bilgi", self.root)
         
-        # Persist signing options when changed
+        # Persist signing options when changed (coalesced into one write)
+        self._ltv_trace = self._tsa_trace = None
+        try:
+            self._ltv_trace = self.ltv_var.trace_add('write', self._on_signing_option_write)
+        except Exception:
+            pass
         try:
-            self.ltv_var.trace_add('write', lambda *a: self._save_signing_settings())
+            self._tsa_trace = self.tsa_enabled_var.trace_add('write', self._on_signing_option_write)
         except Exception:
             pass
         try:
-            self.tsa_enabled_var.trace_add('write', lambda *a: self._save_signing_settings())
+            self.pdf_preview_var.trace_add('write', self._on_signing_option_write)
         except Exception:
             pass
         try:
-            self.docmdp_combo.bind('<<ComboboxSelected>>', lambda e: self._save_signing_settings())
+            self.docmdp_combo.bind('<<ComboboxSelected>>', lambda e: self._schedule_save_signing_settings())
         except Exception:
             pass
 
@@ -714,8 +1034,7 @@ class ModernTTKApp:
         auth_frame.grid(row=3, column=0, columnspan=3, sticky=EW, pady=5, padx=5)
         # Normalize columns: PIN label, PIN entry, Multi-Sig, Sign button
         auth_frame.columnconfigure(0, weight=0, minsize=60)  # PIN label
-        auth_frame.columnconfigure(1, weight=0)  # PIN entry
-        auth_frame.columnconfigure(2, weight=0)  # Multi-Sig checkbox
+        # Columns 1-2 (PIN entry, Multi-Sig checkbox) keep the default weight 0
         auth_frame.columnconfigure(3, weight=1)  # Sign button (fills remaining space)
         self.auth_frame = auth_frame  # expose for layout reference
         
@@ -850,95 +1169,60 @@ class ModernTTKApp:
         # İlk yüklemede görseli göster - daha erken yükle reflow sorununu önlemek için
         self.root.after(100, self._update_signature_image_display)
 
-        sig_conf = self.config.get('signature', {}) if getattr(self, 'config', None) else {}
+        # Stored settings over the defaults, resolved once for all rows
+        sig_conf = SignatureSettings.from_dict((self.config.get('signature') if getattr(self, 'config', None) else None) or {})
 
         # Metin Ayarları: her satır bir `Frame` içinde label + kontrol olacak (tek sütun)
         # Row 0: Logo Gen. - label left, spinbox right
-        row0 = ttk.Frame(sig_frame)
-        row0.grid(row=0, column=0, sticky=EW, padx=0, pady=3)
-        row0.columnconfigure(0, weight=0, minsize=100)  # Label column: sabit genişlik
-        row0.columnconfigure(1, weight=0)  # Spinbox: compact
-        ttk.Label(row0, text='Logo Gen.').grid(row=0, column=0, sticky=W)
-        self.sig_logo_width_var = ttk.Variable(value=sig_conf.get('logo_width_mm', 20.0))
+        row0, _ = self._build_sig_row(sig_frame, 0, 'Logo Gen.')
+        self.sig_logo_width_var = ttk.Variable(value=sig_conf['logo_width_mm'])
         self.sig_logo_width_entry = ttk.Spinbox(row0, from_=5.0, to=150.0, increment=1, command=self._on_logo_width_spin, textvariable=self.sig_logo_width_var, bootstyle='primary', width="6")
         self.sig_logo_width_entry.grid(row=0, column=1, sticky=E, padx=(4,0))
         self.sig_logo_width_entry.bind('<Up>', self._on_logo_width_arrow)
         self.sig_logo_width_entry.bind('<Down>', self._on_logo_width_arrow)
 
         # Row 1: Font Boyutu
-        row1 = ttk.Frame(sig_frame)
-        row1.grid(row=1, column=0, sticky=EW, padx=0, pady=3)
-        row1.columnconfigure(0, weight=0, minsize=100)  # Label column: sabit genişlik
-        row1.columnconfigure(1, weight=0)  # Spinbox: compact
-        ttk.Label(row1, text='Font Boyutu:').grid(row=0, column=0, sticky=W)
-        self.sig_width_var = ttk.Variable(value=sig_conf.get('width_mm', 4.5))
+        row1, _ = self._build_sig_row(sig_frame, 1, 'Font Boyutu:')
+        self.sig_width_var = ttk.Variable(value=sig_conf['width_mm'])
         self.sig_width_entry = ttk.Spinbox(row1, from_=1.0, to=50.0, increment=0.5, command=self._on_width_spin, textvariable=self.sig_width_var, bootstyle='primary', width=6)
         self.sig_width_entry.grid(row=0, column=1, sticky=E, padx=(4,0))
         self.sig_width_entry.bind('<Up>', self._on_width_arrow)
         self.sig_width_entry.bind('<Down>', self._on_width_arrow)
 
-        # Row 2: Yatay Hiz.
-        row2 = ttk.Frame(sig_frame)
-        # Start hidden to prevent layout reflow
-        # row2.grid(row=2, column=0, sticky=EW, padx=0, pady=3)
-        row2.columnconfigure(0, weight=0, minsize=100)  # Label column: sabit genişlik
-        row2.columnconfigure(1, weight=0)  # Spinbox: compact
-        self.sig_label_margin_x = ttk.Label(row2, text='Yatay Hiz.')
-        self.sig_label_margin_x.grid(row=0, column=0, sticky=W)
-        self.sig_margin_x_var = ttk.Variable(value=sig_conf.get('margin_x_mm', sig_conf.get('margin_mm', DEFAULT_SIGNATURE_SETTINGS['margin_mm'])))
+        # Row 2: Yatay Hiz. (start hidden to prevent layout reflow)
+        row2, self.sig_label_margin_x = self._build_sig_row(sig_frame, 2, 'Yatay Hiz.', show=False)
+        self.sig_margin_x_var = ttk.Variable(value=sig_conf['margin_x_mm'])
         self.sig_margin_x_entry = ttk.Spinbox(row2, from_=-100, to=1000, increment=1, textvariable=self.sig_margin_x_var, bootstyle='primary', width=6)
         self.sig_margin_x_entry.grid(row=0, column=1, sticky=E, padx=(4,0))
         self.sig_margin_x_entry.bind('<Up>', self._on_margin_x_arrow)
         self.sig_margin_x_entry.bind('<Down>', self._on_margin_x_arrow)
 
-        # Row 3: Dikey Hiz.
-        row3 = ttk.Frame(sig_frame)
-        # Start hidden to prevent layout reflow
-        # row3.grid(row=3, column=0, sticky=EW, padx=0, pady=3)
-        row3.columnconfigure(0, weight=0, minsize=100)  # Label column: sabit genişlik
-        row3.columnconfigure(1, weight=0)  # Spinbox: compact
-        self.sig_label_margin_y = ttk.Label(row3, text='Dikey Hiz.')
-        self.sig_label_margin_y.grid(row=0, column=0, sticky=W)
-        self.sig_margin_y_var = ttk.Variable(value=sig_conf.get('margin_y_mm', sig_conf.get('margin_mm', DEFAULT_SIGNATURE_SETTINGS['margin_mm'])))
+        # Row 3: Dikey Hiz. (start hidden to prevent layout reflow)
+        row3, self.sig_label_margin_y = self._build_sig_row(sig_frame, 3, 'Dikey Hiz.', show=False)
+        self.sig_margin_y_var = ttk.Variable(value=sig_conf['margin_y_mm'])
         self.sig_margin_y_entry = ttk.Spinbox(row3, from_=-100, to=1000, increment=1, textvariable=self.sig_margin_y_var, bootstyle='primary', width=6)
         self.sig_margin_y_entry.grid(row=0, column=1, sticky=E, padx=(4,0))
         self.sig_margin_y_entry.bind('<Up>', self._on_margin_y_arrow)
         self.sig_margin_y_entry.bind('<Down>', self._on_margin_y_arrow)
 
-        # Row 4: Yer (placement)
-        row4 = ttk.Frame(sig_frame)
-        # Start hidden to prevent layout reflow
-        # row4.grid(row=4, column=0, sticky=EW, padx=0, pady=3)
-        row4.columnconfigure(0, weight=0, minsize=100)  # Label column: sabit genişlik
-        row4.columnconfigure(1, weight=0)  # Combobox: compact
-        self.sig_label_placement = ttk.Label(row4, text='Yer')
-        self.sig_label_placement.grid(row=0, column=0, sticky=W)
-        placement_vals = [p[1] for p in PLACEMENT_OPTIONS]
-        placement_map = {p[1]: p[0] for p in PLACEMENT_OPTIONS}
-        self._placement_map = placement_map
-        placement_code = sig_conf.get('placement', DEFAULT_SIGNATURE_SETTINGS['placement'])
-        placement_display = next((d for c,d in PLACEMENT_OPTIONS if c == placement_code), DEFAULT_SIGNATURE_SETTINGS['placement'])
+        # Row 4: Yer (placement, start hidden to prevent layout reflow)
+        row4, self.sig_label_placement = self._build_sig_row(sig_frame, 4, 'Yer', show=False)
+        self._placement_map = PLACEMENT_CODE_BY_LABEL
+        placement_code = sig_conf['placement']
+        placement_display = PLACEMENT_LABEL_BY_CODE.get(placement_code, PLACEMENT_LABEL_BY_CODE[DEFAULT_SIGNATURE_SETTINGS.placement])
         self.sig_placement_var = ttk.Variable(value=placement_display)
-        try:
-            Combobox
-        except Exception:
-            from ttkbootstrap import Combobox as _CB
-            globals()['Combobox'] = _CB
-        self.placement_combo = Combobox(row4, textvariable=self.sig_placement_var, values=placement_vals, width=8, state='readonly')
+        self.placement_combo = Combobox(row4, textvariable=self.sig_placement_var, values=PLACEMENT_LABELS, width=8, state='readonly')
         self.placement_combo.grid(row=0, column=1, sticky=E, padx=(4,0))
+        # Open dropdown on click but ensure combobox gets focus first so keyboard events don't affect previously-focused widget
         self.placement_combo.bind('<Button-1>', self._on_placement_click, add='+')
 
         # Hidden rows kept in memory for future use, but not displayed initially
         self.hidden_rows = {'row2': row2, 'row3': row3, 'row4': row4}
         
         # Row 5: Font (label left, combobox right; match spinbox width)
-        row5 = ttk.Frame(sig_frame)
-        row5.grid(row=5, column=0, sticky=EW, padx=0, pady=3)
-        row5.columnconfigure(0, weight=0, minsize=100)  # Label column: sabit genişlik
-        row5.columnconfigure(1, weight=0)  # Combobox: compact
-        ttk.Label(row5, text='Font:').grid(row=0, column=0, sticky=W)
+        row5, _ = self._build_sig_row(sig_frame, 5, 'Font:')
         font_families = ['Segoe', 'Arial', 'Times', 'Verdana', 'Tahoma', 'Courier']
-        self.sig_font_var = ttk.Variable(value=sig_conf.get('font_family', 'Segoe'))
+        self.sig_font_var = ttk.Variable(value=sig_conf['font_family'])
         # Use same visual width as spinboxes
         self.font_combo = Combobox(row5, textvariable=self.sig_font_var, values=font_families, width=8, state='readonly')
         self.font_combo.grid(row=0, column=1, sticky=E, padx=(4,0))
@@ -948,13 +1232,9 @@ class ModernTTKApp:
             pass
 
         # Row 6: Stil (label left, combobox right; match spinbox width)
-        row6 = ttk.Frame(sig_frame)
-        row6.grid(row=6, column=0, sticky=EW, padx=0, pady=3)
-        row6.columnconfigure(0, weight=0, minsize=100)  # Label column: sabit genişlik
-        row6.columnconfigure(1, weight=0)  # Combobox: compact
-        ttk.Label(row6, text='Stil:').grid(row=0, column=0, sticky=W)
+        row6, _ = self._build_sig_row(sig_frame, 6, 'Stil:')
         font_styles = ['Normal', 'Bold', 'Italic']
-        self.sig_style_var = ttk.Variable(value=sig_conf.get('font_style', 'Bold'))
+        self.sig_style_var = ttk.Variable(value=sig_conf['font_style'])
         self.style_combo = Combobox(row6, textvariable=self.sig_style_var, values=font_styles, width=8, state='readonly')
         self.style_combo.grid(row=0, column=1, sticky=E, padx=(4,0))
         try:
@@ -962,57 +1242,49 @@ class ModernTTKApp:
         except Exception:
             pass
 
-        # Open dropdown on click but ensure combobox gets focus first so keyboard events don't affect previously-focused widget
-        self.placement_combo.bind('<Button-1>', self._on_placement_click, add='+')
 
         # Auto-refresh preview and schedule auto-save when signature controls change (trace variables)
         try:
-            self.sig_font_var.trace_add('write', lambda *a: (self._refresh_sig_info_font(), self._update_preview() if not getattr(self, '_is_dragging', False) else None, self._schedule_save_signature_settings()))
-            self.sig_style_var.trace_add('write', lambda *a: (self._refresh_sig_info_font(), self._update_preview() if not getattr(self, '_is_dragging', False) else None, self._schedule_save_signature_settings()))
-            self.sig_width_var.trace_add('write', lambda *a: (self._update_preview() if not getattr(self, '_is_dragging', False) else None, self._schedule_save_signature_settings()))
-            self.sig_logo_width_var.trace_add('write', lambda *a: (self._update_preview() if not getattr(self, '_is_dragging', False) else None, self._schedule_save_signature_settings()))
-            # For margins we want live updates even during drag; use debounced auto refresh and persist immediately
-            self.sig_margin_x_var.trace_add('write', lambda *a: (self._auto_refresh_preview(), self._schedule_save_signature_settings()))
-            self.sig_margin_y_var.trace_add('write', lambda *a: (self._auto_refresh_preview(), self._schedule_save_signature_settings()))
-            self.sig_placement_var.trace_add('write', lambda *a: (self._on_placement_change() if not getattr(self, '_is_dragging', False) else None, self._schedule_save_signature_settings()))
+            # Writes only mark what changed; one flush per frame does the work (see _flush_sig_refresh)
+            self.sig_font_var.trace_add('write', self._on_sig_font_write)
+            self.sig_style_var.trace_add('write', self._on_sig_font_write)
+            self.sig_width_var.trace_add('write', self._on_sig_geom_write)
+            self.sig_logo_width_var.trace_add('write', self._on_sig_geom_write)
+            # Margin traces are detached while dragging (see _suspend_margin_traces)
+            self._margin_traces = {
+                var: var.trace_add('write', self._on_sig_margin_write)
+                for var in (self.sig_margin_x_var, self.sig_margin_y_var)
+            }
+            self.sig_placement_var.trace_add('write', self._on_sig_placement_write)
         except Exception:
             # Older tkinter may not support trace_add; fallback
             try:
-                self.sig_width_var.trace('w', lambda *a: (self._auto_refresh_preview(), self._schedule_save_signature_settings()))
-                self.sig_logo_width_var.trace('w', lambda *a: (self._auto_refresh_preview(), self._schedule_save_signature_settings()))
-                self.sig_margin_x_var.trace('w', lambda *a: (self._auto_refresh_preview(), self._schedule_save_signature_settings()))
-                self.sig_margin_y_var.trace('w', lambda *a: (self._auto_refresh_preview(), self._schedule_save_signature_settings()))
-                self.sig_placement_var.trace('w', lambda *a: (self._auto_refresh_preview(), self._schedule_save_signature_settings()))
+                self.sig_font_var.trace('w', self._on_sig_font_write)
+                self.sig_style_var.trace('w', self._on_sig_font_write)
+                self.sig_width_var.trace('w', self._on_sig_geom_write)
+                self.sig_logo_width_var.trace('w', self._on_sig_geom_write)
+                # Same callbacks as above, so margin and placement changes
+                # take the cheap reposition path here too
+                self.sig_margin_x_var.trace('w', self._on_sig_margin_write)
+                self.sig_margin_y_var.trace('w', self._on_sig_margin_write)
+                self.sig_placement_var.trace('w', self._on_sig_placement_write)
             except Exception:
                 pass
 
         # Select-all-on-click/focus for signature and template entries — improved UX
+        # One class-level binding shared by all entries via a custom bindtag,
+        # placed right after the widget's own tag (before the Entry class bindings)
         try:
+            self.root.bind_class('SelectAllEntry', '<FocusIn>', self._select_all_entry)
+            self.root.bind_class('SelectAllEntry', '<Button-1>', self._select_all_entry)
+            self.root.bind_class('SelectAllEntry', '<FocusOut>', self._clear_entry_selection)
             entries = (self.sig_width_entry, self.sig_logo_width_entry, self.sig_margin_x_entry, self.sig_margin_y_entry, self.reason_entry, self.location_entry)
             for e in entries:
                 if not e:
                     continue
-                # Bind to the entry widget specifically for spinboxes
-                if hasattr(e, 'tk'):
-                    # For spinbox, bind to the internal entry
-                    try:
-                        entry_widget = e.tk.call(e._w, 'identify', 'element')
-                        if 'entry' in str(entry_widget):
-                            e.bind('<FocusIn>', self._select_all_entry, add='+')
-                            e.bind('<Button-1>', self._select_all_entry, add='+')
-                            e.bind('<FocusOut>', self._clear_entry_selection, add='+')
-                        else:
-                            e.bind('<FocusIn>', self._select_all_entry, add='+')
-                            e.bind('<Button-1>', self._select_all_entry, add='+')
-                            e.bind('<FocusOut>', self._clear_entry_selection, add='+')
-                    except:
-                        e.bind('<FocusIn>', self._select_all_entry, add='+')
-                        e.bind('<Button-1>', self._select_all_entry, add='+')
-                        e.bind('<FocusOut>', self._clear_entry_selection, add='+')
-                else:
-                    e.bind('<FocusIn>', self._select_all_entry, add='+')
-                    e.bind('<Button-1>', self._select_all_entry, add='+')
-                    e.bind('<FocusOut>', self._clear_entry_selection, add='+')
+                tags = e.bindtags()
+                if 'SelectAllEntry' not in tags:
+                    e.bindtags(tags[:1] + ('SelectAllEntry',) + tags[1:])
         except Exception:
             pass
 
@@ -1036,9 +1308,7 @@ class ModernTTKApp:
             hint_frame = ttk.Frame(sig_frame)
             # Place hint only in the left column so it can't force the right column / outer layout to expand
             hint_frame.grid(row=8, column=0, sticky=W, padx=0, pady=(6,2))
-            # Prevent the hint from dictating the column width
-            hint_frame.columnconfigure(0, weight=0)
-            hint_frame.columnconfigure(1, weight=0)
+            # Columns keep the default weight 0 so the hint can't dictate the column width
             arrow_lbl = ttk.Label(hint_frame, text='◀', font=(FONT_FAMILY, 11, 'bold'), foreground='red')
             # Left-align the arrow and remove vertical centering
             arrow_lbl.grid(row=0, column=0, sticky=W)
@@ -1058,9 +1328,7 @@ class ModernTTKApp:
             pass
         
         # CRITICAL: Configure row/column weights for sign_tab so sign_btn is visible
-        self.sign_tab.columnconfigure(0, weight=1)
-        self.sign_tab.columnconfigure(1, weight=1)
-        self.sign_tab.columnconfigure(2, weight=1)  
+        self.sign_tab.columnconfigure((0, 1, 2), weight=1)
         
         # ===== LOG PANEL (BOTTOM) =====
         # Log container - a dedicated frame inside main_frame to ensure the
@@ -1093,51 +1361,12 @@ class ModernTTKApp:
         )
         log_txt.grid(row=0, column=0, sticky='nsew')
         self.log_text = log_txt
+        self.root.after(LOG_QUEUE_POLL_INTERVAL, self._drain_ui_queue)
 
         # Configure log filtering
-        try:
-            self._log_matchers = {
-                1: 'Numpad imzalama hatası',
-                2: "PKCS#11 DLL seçiliyor",
-                3: 'Seçildi:',
-                4: 'Seçilen DLL içinde token aranıyor',
-                5: '⚠️ Hata:',
-                6: 'Token bulundu',
-                7: 'Token bulunamadı',
-                10: 'Tarama hatası',
-                11: 'Tarama tamamlandı:',
-                12: 'Auto-selected',
-                14: '📂 Giriş',
-                15: '➕ Önerilen çıkış',
-                16: '📂 Çıkış',
-                19: 'Token ve sertifika bulundu',
-                20: 'Token bulunamadı',
-                21: 'İmzalama işlemi başlatılıyor',
-                22: '⚠️ Hata:',
-                24: 'DLL yüklenemedi',
-                25: 'Token listesi hatası',
-                26: 'Token listesi okunamadı',
-                27: 'DLL yüklenemedi',
-                28: 'Slot arama hatası',
-                29: 'Seçilen token bulunamadı',
-                30: 'Sertifika okuma hatası',
-                31: 'Sertifika okunamadı',
-                32: 'İmza ayarları kaydedildi',
-                33: 'İmza ayarları kaydedilemedi',
-                34: 'İmza ayarları sıfırlandı',
-                35: 'Sıfırlama başarısız',
-                37: 'Geçersiz imza ayar değeri',
-                39: 'İmza resmi okunurken hata',
-                41: 'İmza ayarları kaydedilemedi',
-                42: 'İptal isteği gönderildi',
-                43: 'Token listesi yenilendi'
-            }
-            self._log_enabled_numbers = set([1,2,3,4,5,6,7,10,11,12,14,15,16,19,20,21,22,24,25,26,27,28,29,30,31,32,33,34,35,37,39,41,42,43])
-            self._log_archive = []
-        except Exception:
-            self._log_matchers = {}
-            self._log_enabled_numbers = set()
-            self._log_archive = []
+        self._log_matchers = _LOG_MATCHERS
+        self._log_enabled_numbers = _LOG_ENABLED_DEFAULT
+        self._rebuild_log_filter()
         
         v_scrollbar = ttk.Scrollbar(log_frame, orient=VERTICAL, command=log_txt.yview)
         v_scrollbar.grid(row=0, column=1, sticky='ns')
@@ -1156,6 +1385,21 @@ class ModernTTKApp:
         )
         footer_label.grid(row=0, column=0, sticky='w', padx=20, pady=5)
 
+    def _build_sig_row(self, parent, row, text, show=True):
+        """Create one signature settings row: fixed-width label left, compact control right.
+
+        Returns (frame, label); the caller grids its control into column 1.
+        Rows built with show=False are kept ungridded until needed.
+        """
+        frame = ttk.Frame(parent)
+        if show:
+            frame.grid(row=row, column=0, sticky=EW, padx=0, pady=3)
+        frame.columnconfigure(0, weight=0, minsize=100)  # Label column: sabit genişlik
+        # Control column keeps the default weight 0 (compact)
+        label = ttk.Label(frame, text=text)
+        label.grid(row=0, column=0, sticky=W)
+        return frame, label
+
     def _clear_entry_selection(self, event):
         """Clear any selection when entry loses focus to avoid lingering highlighted text."""
         try:
@@ -1205,68 +1449,111 @@ class ModernTTKApp:
         sep = ttk.Separator(hdr, orient=HORIZONTAL)
         sep.grid(row=0, column=1, sticky='ew', padx=(6,0))
     
+    def _rebuild_log_filter(self):
+        """Compile the enabled log matchers into a single pattern.
+
+        One regex search replaces a Python-level substring test per matcher.
+        Call again whenever `_log_matchers` or `_log_enabled_numbers` change;
+        None means no filter (everything is displayed).
+        """
+        try:
+            pats = {self._log_matchers.get(num) for num in self._log_enabled_numbers}
+            pats.discard(None)
+            pats.discard('')
+            if not self._log_enabled_numbers:
+                self._log_filter_re = None
+            elif pats:
+                self._log_filter_re = re.compile('|'.join(map(re.escape, sorted(pats))))
+            else:
+                # Filter enabled but nothing matches: hide everything
+                self._log_filter_re = re.compile(r'(?!)')
+        except Exception:
+            self._log_filter_re = None
+
     def log_message(self, msg):
         """Write a message to the onscreen log Text widget if available, otherwise print to stdout.
-        All messages are archived to `self._log_archive`. If a log filter is configured
-        via `_configure_log_filter`, only messages that match the enabled number set
+        All messages are archived to `self._log_archive` (the last LOG_ARCHIVE_SIZE). If a log filter is configured
+        via `_rebuild_log_filter`, only messages that match the enabled number set
         will be shown in the UI; all are still archived for later inspection.
         """
-        try:
-            # Ensure archive exists
-            if not hasattr(self, '_log_archive'):
-                self._log_archive = []
+        if threading.get_ident() != self._main_thread_id:
+            # Tk is not thread-safe: hand over to the drain tick
+            self._ui_queue.put(msg)
+            return
+        self._log_archive.append(msg)
+        if self.log_text is None:
+            # Only print to console if there is no GUI log target
             try:
-                self._log_archive.append(msg)
+                print(msg)
+            except Exception:
+                pass
+            return
+        if not self._should_display(msg):
+            # Message filtered out from UI only
+            return
+        # Queue for the next batched insert (see _flush_log)
+        self._log_pending.append(f"{msg}\n")
+        if not self._log_flush_scheduled:
+            try:
+                self.root.after(LOG_FLUSH_INTERVAL, self._flush_log)
+                self._log_flush_scheduled = True
             except Exception:
                 pass
 
-            # Helper: determine whether message should be displayed according to filter
-            def _should_display(m):
-                try:
-                    # If no filter configured, display everything
-                    if not getattr(self, '_log_enabled_numbers', None):
-                        return True
-                    # Use matchers map to check if message belongs to an enabled number
-                    for num in self._log_enabled_numbers:
-                        pat = self._log_matchers.get(num)
-                        if pat and pat in m:
-                            return True
-                    return False
-                except Exception:
-                    return True
-
-            # Prefer the current attribute name used in build_ui
-            target = None
-            if hasattr(self, 'log_text') and self.log_text:
-                target = self.log_text
-            elif hasattr(self, 'log') and self.log:
-                target = self.log
-
-            # Only print to console if there is no GUI log target
-            if not target:
-                try:
-                    print(msg)
-                except Exception:
-                    pass
+    def _drain_ui_queue(self):
+        """Apply worker-thread messages and UI updates, then re-arm the tick.
 
-            if target:
+        Workers put log strings, or callables for widget updates, on
+        `_ui_queue` instead of scheduling one root.after(0) each; a burst is
+        picked up here in one pass, in the order it was queued, and the log
+        lines land in a single batched insert (see _flush_log).
+        """
+        try:
+            while True:
                 try:
-                    if _should_display(msg):
-                        target.insert("end", msg + "\n")
-                        target.see("end")
-                        return
-                    else:
-                        # Message filtered out from UI only
-                        return
-                except Exception:
-                    pass
-            # No UI target available
-            return
-        except Exception:
+                    item = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if callable(item):
+                    try:
+                        item()
+                    except Exception as e:
+                        self.log_message(f"⚠️ Arayüz güncelleme hatası: {e}")
+                else:
+                    self.log_message(item)
+        finally:
             try:
-                print(msg)
+                self.root.after(LOG_QUEUE_POLL_INTERVAL, self._drain_ui_queue)
             except Exception:
                 pass
+
+    def _should_display(self, msg):
+        """Return True if msg passes the log filter (no filter: everything passes)."""
+        log_filter = self._log_filter_re
+        return log_filter is None or log_filter.search(msg) is not None
+
+    def _flush_log(self):
+        """Insert all queued log lines with a single Text insert and scroll."""
+        self._log_flush_scheduled = False
+        pending, self._log_pending = self._log_pending, []
+        if not pending:
+            return
+        target = self.log_text
+        if target is None:
+            return
+        try:
+            target.insert("end", "".join(pending))
+            # Drop the oldest lines so the widget stays small in long sessions
+            lines = int(target.index("end-1c").split(".")[0])
+            if lines > LOG_MAX_LINES:
+                target.delete("1.0", f"{lines - LOG_MAX_LINES}.0")
+            target.see("end")
+        except Exception:
+            pass
+
+    def get_log_archive(self):
+        """Return the archived log messages, oldest first."""
+        return list(self._log_archive)
     
     def browse_pkcs11(self):
         self.log_message("📂 PKCS#11 DLL seçiliyor...")
@@ -1283,22 +1570,20 @@ class ModernTTKApp:
         self.log_message(f"Seçildi: {path}")
 
         def worker(selected):
-            self.root.after(0, lambda: self.log_message("🔍 Seçilen DLL içinde token aranıyor..."))
+            self._ui_queue.put("🔍 Seçilen DLL içinde token aranıyor...")
             try:
                 has = has_tokens_in_pkcs11_lib(selected)
             except Exception as exc:
                 msg = str(exc)
-                self.root.after(0, lambda m=msg: self.log_message(f"⚠️ Hata: {m}"))
+                self._ui_queue.put(f"⚠️ Hata: {msg}")
                 has = False
             if has:
-                self.root.after(0, lambda: self.log_message("✅ Token bulundu."))
+                self._ui_queue.put("✅ Token bulundu.")
             else:
-                self.root.after(0, lambda: self.log_message("❌ Token bulunamadı."))
-                # clear combos
-                self.root.after(0, lambda: self.token_combo.configure(values=['(none)']))
-                self.root.after(0, lambda: self.cert_combo.configure(values=['(none)']))
+                self._ui_queue.put("❌ Token bulunamadı.")
+                self._ui_queue.put(self._clear_token_combos)
             try:
-                threading.Thread(target=self._update_tokens_internal, daemon=True).start()
+                self._update_tokens_internal(selected)
             except Exception:
                 pass
 
@@ -1311,60 +1596,135 @@ class ModernTTKApp:
         self._pkcs11_scanning = True
         self.log_message("🔍 PKCS#11 DLL'leri otomatik aranıyor...")
 
+        # Persisted probe results: {path: [mtime, size, is_provider]}
+        try:
+            cache = dict((self.config or {}).get('pkcs11_cache') or {})
+        except Exception:
+            cache = {}
+
         def worker():
             try:
-                candidates = find_pkcs11_candidates()
-            except Exception as exc:
-                candidates = []
-                self.root.after(0, lambda m=str(exc): self.log_message(f"⚠️ Tarama hatası: {m}"))
+                scan()
+            finally:
+                # Always release the re-entrancy guard, even if the scan failed
+                self._pkcs11_scanning = False
 
-            self.root.after(0, lambda c=len(candidates): self.log_message(f"Tarama tamamlandı: {c} aday bulundu."))
+        def scan():
+            probed = {}
 
-            chosen = None
-            for p in candidates:
+            def probe(pstr):
+                """Return True when pstr is a PKCS#11 provider with a token present.
+
+                The provider check is skipped when the DLL's mtime/size match the
+                cached entry; token presence is always probed (cards come and go).
+                """
                 try:
-                    pstr = str(p)
-                    if not is_pkcs11_provider(pstr):
-                        self.root.after(0, lambda m=f"❌ {Path(pstr).name}: Geçersiz PKCS#11 sağlayıcı": self.log_message(m))
-                        continue
-                    if not has_tokens_in_pkcs11_lib(pstr):
-                        self.root.after(0, lambda m=f"❌ {Path(pstr).name}: Token bulunamadı": self.log_message(m))
-                        continue
-                    chosen = pstr
-                    self.root.after(0, lambda m=f"✅ {Path(chosen).name}: Geçerli token bulundu!": self.log_message(m))
-                    break
+                    st = os.stat(pstr)
+                    stamp = [st.st_mtime, st.st_size]
+                except OSError:
+                    stamp = None
+                cached = cache.get(pstr)
+                if stamp and cached and list(cached[:2]) == stamp:
+                    provider = bool(cached[2])
+                else:
+                    provider = bool(is_pkcs11_provider(pstr))
+                if stamp:
+                    probed[pstr] = stamp + [provider]
+                if not provider:
+                    self._ui_queue.put(f"❌ {os.path.basename(pstr)}: Geçersiz PKCS#11 sağlayıcı")
+                    return False
+                if not has_tokens_in_pkcs11_lib(pstr):
+                    self._ui_queue.put(f"❌ {os.path.basename(pstr)}: Token bulunamadı")
+                    return False
+                return True
+
+            def check(pstr, fut):
+                try:
+                    ok = fut.result() if fut is not None else probe(pstr)
                 except Exception as e:
-                    self.root.after(0, lambda m=f"⚠️ {Path(pstr).name}: Hata - {str(e)}": self.log_message(m))
-                    continue
+                    self._ui_queue.put(f"⚠️ {os.path.basename(pstr)}: Hata - {str(e)}")
+                    return False
+                if ok:
+                    self._ui_queue.put(f"✅ {os.path.basename(pstr)}: Geçerli token bulundu!")
+                return ok
+
+            def try_candidates(paths):
+                """Probe candidates; return the first hit in priority order.
+
+                From source the token probe runs in a subprocess, so a few run
+                at once. A frozen build loads each module in this process
+                (python-pkcs11 state is process-global and vendor initializers
+                aren't thread-safe), so there they run one by one.
+                """
+                import sys
+                paths = [p for p in dict.fromkeys(paths) if p not in probed]
+                if not paths:
+                    return None
+                if getattr(sys, '_MEIPASS', None) or len(paths) == 1:
+                    for pstr in paths:
+                        if check(pstr, None):
+                            return pstr
+                    return None
+                pool = ThreadPoolExecutor(max_workers=min(_PKCS11_PROBE_WORKERS, len(paths)))
+                try:
+                    futures = [(pstr, pool.submit(probe, pstr)) for pstr in paths]
+                    for pstr, fut in futures:
+                        if check(pstr, fut):
+                            return pstr
+                    return None
+                finally:
+                    # Drop queued lower-priority probes, but let running ones
+                    # finish before the chosen module is opened
+                    pool.shutdown(wait=True, cancel_futures=True)
+
+            # Known providers from the last run first; skip the filesystem scan on a hit
+            chosen = try_candidates([p for p, v in cache.items() if v and v[2]])
+
+            if not chosen:
+                try:
+                    candidates = find_pkcs11_candidates()
+                except Exception as exc:
+                    candidates = []
+                    self._ui_queue.put(f"⚠️ Tarama hatası: {exc}")
+
+                self._ui_queue.put(f"Tarama tamamlandı: {len(candidates)} aday bulundu.")
+                chosen = try_candidates([str(p) for p in candidates])
+
+            self._ui_queue.put(lambda c=dict(probed): self._store_pkcs11_cache(c))
 
             if chosen:
-                self.root.after(0, lambda: self.pkcs11_var.set(chosen))
-                self.root.after(0, lambda: self.log_message(f"✅ Auto-selected: {Path(chosen).name}"))
+                self._ui_queue.put(lambda: self.pkcs11_var.set(chosen))
+                self._ui_queue.put(f"✅ Auto-selected: {Path(chosen).name}")
                 try:
                     # Pass explicit path to avoid race condition with UI var update
-                    threading.Thread(target=self._update_tokens_internal, args=(chosen,), daemon=True).start()
+                    self._update_tokens_internal(chosen)
                 except Exception:
                     pass
             else:
-                self.root.after(0, lambda: self.log_message('❌ No candidate DLLs found. Use "Gözat" to add one manually.'))
-                self.root.after(0, lambda: messagebox.showinfo("Sonuç", "DLL bulunamadı. Lütfen elle ekleyin."))
-            self._pkcs11_scanning = False
+                self._ui_queue.put('❌ No candidate DLLs found. Use "Gözat" to add one manually.')
+                self._ui_queue.put(lambda: messagebox.showinfo("Sonuç", "DLL bulunamadı. Lütfen elle ekleyin."))
 
         threading.Thread(target=worker, daemon=True).start()
+
+    def _store_pkcs11_cache(self, probed):
+        """Merge fresh PKCS#11 probe results into the persisted cache (Tk thread)."""
+        try:
+            if not probed:
+                return
+            if getattr(self, 'config', None) is None:
+                self.config = {}
+            cache = self.config.get('pkcs11_cache') or {}
+            cache = {p: v for p, v in cache.items() if os.path.exists(p)}
+            cache.update(probed)
+            self.config['pkcs11_cache'] = cache
+            save_config(self.config)
+        except Exception:
+            pass
+
     def browse_in(self):
         # Determine initial directory: prefer folder in the input textbox, fall back to output folder or CWD
         try:
-            cur = self.in_var.get()
-            curp = Path(cur) if cur else None
-            if curp and curp.exists():
-                initialdir = str(curp) if curp.is_dir() else str(curp.parent)
-            else:
-                out_cur = self.out_var.get()
-                outp = Path(out_cur) if out_cur else None
-                if outp and outp.exists():
-                    initialdir = str(outp.parent if outp.is_file() else outp)
-                else:
-                    initialdir = str(Path.cwd())
+            initialdir = _dialog_initial_dir(self.in_var.get(), self.out_var.get())
         except Exception:
             initialdir = str(Path.cwd())
 
@@ -1373,7 +1733,7 @@ class ModernTTKApp:
             self.in_var.set(path)
             self.log_message(f"📂 Giriş: {path}")
             # PDF seçildiğinde arka plan şablonunu oluştur
-            threading.Thread(target=self._generate_template_from_pdf, args=(path,), daemon=True).start()
+            self._request_template(path)
             try:
                 p = Path(path)
                 if not self.out_var.get():
@@ -1386,17 +1746,7 @@ class ModernTTKApp:
     def browse_out(self):
         # Prefer the folder already in the output textbox; if missing, try the input textbox's folder; otherwise use CWD
         try:
-            cur = self.out_var.get()
-            curp = Path(cur) if cur else None
-            if curp and cur.exists():
-                initialdir = str(curp.parent if curp.is_file() else curp)
-            else:
-                in_cur = self.in_var.get()
-                inp = Path(in_cur) if in_cur else None
-                if inp and inp.exists():
-                    initialdir = str(inp.parent if inp.is_file() else inp)
-                else:
-                    initialdir = str(Path.cwd())
+            initialdir = _dialog_initial_dir(self.out_var.get(), self.in_var.get())
         except Exception:
             initialdir = str(Path.cwd())
         path = filedialog.asksaveasfilename(title="Çıkış PDF kaydet",defaultextension=".pdf", filetypes=[("PDF files","*.pdf"), ("All files","*.*")], initialdir=initialdir)
@@ -1404,25 +1754,92 @@ class ModernTTKApp:
             self.out_var.set(path)
             self.log_message(f"📂 Çıkış: {path}")
 
+    def _request_template(self, pdf_path):
+        """Queue a preview template render, coalescing rapid file changes.
+
+        At most one render thread runs; selections made while it is busy only
+        replace the pending path, so just the last chosen PDF is rendered next.
+        Nothing is rendered while the PDF preview option is off.
+        """
+        try:
+            if not self.pdf_preview_var.get():
+                self._drop_dynamic_template()
+                return
+        except Exception:
+            pass
+        with self._template_lock:
+            self._template_pending = pdf_path
+            if self._template_busy:
+                return
+            self._template_busy = True
+        threading.Thread(target=self._template_worker, daemon=True).start()
+
+    def _on_pdf_preview_toggle(self):
+        """Render the template for the current input PDF when preview is turned on.
+
+        Turning it off switches the canvas back to the static template.
+        """
+        try:
+            if not self.pdf_preview_var.get():
+                self._drop_dynamic_template()
+                self._auto_refresh_preview()
+                return
+            path = self.in_var.get()
+            if path and os.path.isfile(path):
+                self._request_template(path)
+        except Exception:
+            pass
+
+    def _drop_dynamic_template(self):
+        """Delete the rendered page template so a later render starts fresh."""
+        self._dynamic_sablon_src = None
+        try:
+            (TEMP_DIR / 'dynamic_sablon.png').unlink()
+        except OSError:
+            pass
+
+    def _template_worker(self):
+        # Don't render while the startup cleanup may still delete the result
+        self._cleanup_done.wait()
+        while True:
+            with self._template_lock:
+                pdf_path = self._template_pending
+                self._template_pending = None
+                if pdf_path is None:
+                    self._template_busy = False
+                    return
+            self._generate_template_from_pdf(pdf_path)
+
     def _generate_template_from_pdf(self, pdf_path):
         """Seçilen PDF'in ilk sayfasından dinamik bir önizleme şablonu oluşturur."""
+        fitz = _get_fitz()
         if fitz is None:
             self.log_message("ℹ️ PDF önizleme için 'PyMuPDF' gerekli: pip install pymupdf")
             return
 
         try:
-            doc = fitz.open(pdf_path)
-            if len(doc) > 0:
-                page = doc[0]
-                # Use 300 DPI consistently with signature image generation to avoid
-                # coordinate mismatches on different computers (FIX for signature positioning)
-                pix = page.get_pixmap(dpi=300)
-                temp_sablon = TEMP_DIR / 'dynamic_sablon.png'
+            temp_sablon = TEMP_DIR / 'dynamic_sablon.png'
+            # Same file already rendered: nothing to do
+            src_key = (str(Path(pdf_path).resolve()), os.path.getmtime(pdf_path))
+            if src_key == self._dynamic_sablon_src and temp_sablon.exists():
+                self._ui_queue.put(self._auto_refresh_preview)
+                return
+            with fitz.open(pdf_path) as doc:
+                if doc.page_count == 0:
+                    return
+                page = doc.load_page(0)
+                # The template is only a preview background, scaled to the canvas
+                # size when drawn; render at the largest preview size instead of
+                # 300 DPI (signature coordinates are computed in mm, not pixels)
+                zoom = (_PREVIEW_WIN_SCALE * 210) / page.rect.width
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
                 pix.save(str(temp_sablon))
-                self.log_message(f"📄 PDF önizleme şablonu oluşturuldu: {Path(pdf_path).name}")
-                # Önizlemeyi tetikle
-                self._auto_refresh_preview()
-            doc.close()
+                # Free the pixmap's native buffer now rather than at function exit
+                pix = None
+            self._dynamic_sablon_src = src_key
+            self.log_message(f"📄 PDF önizleme şablonu oluşturuldu: {Path(pdf_path).name}")
+            # Önizlemeyi tetikle (debounced, on the Tk thread)
+            self._ui_queue.put(self._auto_refresh_preview)
         except Exception as e:
             self.log_message(f"⚠️ Önizleme şablonu oluşturulamadı: {e}")
 
@@ -1437,9 +1854,8 @@ class ModernTTKApp:
 
         # Basic details display
         try:
-            from cryptography import x509
             msg = f"Etiket: {selected}\n"
-            if isinstance(cert_obj, dict):
+            if isinstance(cert_obj, (dict, _CertInfo)):
                  # Fallback if we stored a dict
                  for k, v in cert_obj.items():
                      msg += f"{k}: {v}\n"
@@ -1464,7 +1880,16 @@ class ModernTTKApp:
         except Exception as e:
             self.log_message(f"Detay görüntüleme hatası: {e}")
 
-    def _update_tokens_internal(self, explicit_path=None):
+    def _update_tokens_internal(self, explicit_path=None, force=False):
+        """Read tokens and certificates from the PKCS#11 module in a worker.
+
+        Certificate lists are cached per (slot id, token serial); force drops
+        the cache so every card is read again. At most one read runs; a module
+        requested meanwhile replaces the pending one and is read next, so the
+        combos always end up matching the last requested DLL.
+        """
+        if force:
+            self._cert_enum_cache.clear()
         if explicit_path:
             lib_path = explicit_path
         else:
@@ -1478,13 +1903,10 @@ class ModernTTKApp:
         if not lib_path:
             return
 
-        self.root.after(0, lambda: self.log_message("⏳ Token içeriği okunuyor..."))
-        
         try:
-            from sign_pdf import load_pkcs11_lib, list_certs
-            
             # Use a thread to avoid freezing UI
-            def worker():
+            def read_tokens(lib_path):
+                self._ui_queue.put("⏳ Token içeriği okunuyor...")
                 try:
                     lib = load_pkcs11_lib(lib_path)
                     
@@ -1503,26 +1925,23 @@ class ModernTTKApp:
                             token_info = f"{token.label} ({token.serial})"
                             token_list.append(token_info)
                             
-                            # List certs
-                            for _, _, label, subject, issuer, serial in list_certs(lib, slot=slot):
+                            # List certs (each read is a smartcard round-trip, so reuse
+                            # the last result for the same card)
+                            cache_key = (slot.slot_id, token.serial)
+                            certs = self._cert_enum_cache.get(cache_key)
+                            if certs is None:
+                                certs = [c[2:] for c in list_certs(lib, slot=slot)]
+                                self._cert_enum_cache[cache_key] = certs
+                            for label, subject, issuer, serial in certs:
                                 # Convert subject string to CN only
                                 # Typical subject: CN=Name Surname, O=Org, C=TR
                                 # We want just "Name Surname"
-                                cn_part = subject
-                                for part in subject.split(','):
-                                    if part.strip().startswith('CN='):
-                                        cn_part = part.strip()[3:]
-                                        break
+                                cn_part = _subject_cn(subject) or subject
                                 
                                 display_name = cn_part
-                                self._cert_map[display_name] = {
-                                    'slot_id': slot.slot_id,
-                                    'token_label': token.label,
-                                    'cert_label': label,
-                                    'subject': subject,
-                                    'issuer': issuer,
-                                    'serial': serial
-                                }
+                                self._cert_map[display_name] = _CertInfo(
+                                    slot.slot_id, token.label, label, subject, issuer, serial
+                                )
                                 found_certs.append(display_name)
                                 
                         except Exception:
@@ -1548,18 +1967,42 @@ class ModernTTKApp:
                             self._cert_combo_var.set('(sertifika yok)')
                             self.log_message("⚠️ Token bulundu ama sertifika okunamadı.")
 
-                    self.root.after(0, update_ui)
+                    # A newer module was requested meanwhile: its read follows
+                    if self._token_pending is None:
+                        self._ui_queue.put(update_ui)
                     
                 except Exception as e:
-                    self.root.after(0, lambda: self.log_message(f"❌ Token okuma hatası: {e}"))
+                    self._ui_queue.put(f"❌ Token okuma hatası: {e}")
 
+            def worker():
+                while True:
+                    with self._token_lock:
+                        path = self._token_pending
+                        self._token_pending = None
+                        if path is None:
+                            self._token_busy = False
+                            return
+                    read_tokens(path)
+
+            with self._token_lock:
+                self._token_pending = lib_path
+                if self._token_busy:
+                    self._ui_queue.put("🔁 Token okuma devam ediyor; yeni seçim ardından okunacak.")
+                    return
+                self._token_busy = True
             threading.Thread(target=worker, daemon=True).start()
             
         except Exception as e:
              self.log_message(f"❌ Kütüphane yükleme hatası: {e}")
 
+    def _clear_token_combos(self):
+        self.token_combo.configure(values=['(none)'])
+        self.cert_combo.configure(values=['(none)'])
+
     def refresh_token(self):
         self.log_message("🔄 Token bilgisi yenileniyor...")
+        # Card may have been swapped: read certificates again next time
+        self._cert_enum_cache.clear()
         path = self.pkcs11_var.get()
         if not path:
             self.log_message("❌ PKCS#11 DLL yolu yok; önce seçin veya ara.")
@@ -1567,42 +2010,81 @@ class ModernTTKApp:
 
         def worker(selected):
             try:
-                has = has_tokens_in_pkcs11_lib(selected)
+                # Module already loaded in this process: ask it directly instead
+                # of probing it again in a subprocess
+                lib = cached_pkcs11_lib(selected)
+                if lib is not None:
+                    has = bool(lib.get_slots(token_present=True))
+                else:
+                    has = has_tokens_in_pkcs11_lib(selected)
             except Exception:
                 has = False
             if has:
-                self.root.after(0, lambda: self.log_message("✅ Token ve sertifika bulundu."))
+                self._ui_queue.put("✅ Token ve sertifika bulundu.")
             else:
-                self.root.after(0, lambda: self.log_message("❌ Token bulunamadı."))
-                self.root.after(0, lambda: self.token_combo.configure(values=['(none)']))
-                self.root.after(0, lambda: self.cert_combo.configure(values=['(none)']))
+                self._ui_queue.put("❌ Token bulunamadı.")
+                self._ui_queue.put(self._clear_token_combos)
 
-        threading.Thread(target=worker, args=(path,), daemon=True).start()
+        if not self._spawn_once('token_probe', worker, (path,)):
+            self.log_message("🔁 Token kontrolü zaten devam ediyor; atlandı.")
+
+    def _spawn_once(self, key, target, args=()):
+        """Run target(*args) in a daemon thread unless one for key is running.
+
+        Returns False (without starting anything) when a worker with the same
+        key is still in flight; the key is released when the target returns.
+        """
+        with self._spawn_lock:
+            busy = self._busy_events.setdefault(key, threading.Event())
+            if busy.is_set():
+                return False
+            busy.set()
+
+        def run():
+            try:
+                target(*args)
+            finally:
+                busy.clear()
+
+        threading.Thread(target=run, daemon=True).start()
+        return True
 
     def _show_notification(self, message, duration=2000):
-        """Show a transparent orange notification in bottom right corner of GUI window."""
-        try:
-            # Create notification window
-            notif = Toplevel(self.root)
-            notif.title("")
-            notif.attributes('-alpha', 0.9)  # 90% transparent
-            notif.attributes('-topmost', True)
-            notif.overrideredirect(True)  # Remove title bar
-            
-            # Orange background
-            notif.config(bg='#FF9800')
-            
-            # Add label
-            label = ttk.Label(
-                notif,
-                text=message,
-                background='#FF9800',
-                foreground='white',
-                font=('Segoe UI', 10, 'bold'),
-                padding=15
-            )
-            label.pack()
-            
+        """Show a transparent orange notification in bottom right corner of GUI window.
+
+        A single notification window is created on first use and then only
+        re-texted, shown and withdrawn; a new message replaces the current one.
+        """
+        try:
+            notif = self._notif
+            if notif is None or not notif.winfo_exists():
+                # Create notification window
+                notif = Toplevel(self.root)
+                notif.withdraw()
+                notif.title("")
+                notif.attributes('-alpha', 0.9)  # 90% transparent
+                notif.attributes('-topmost', True)
+                notif.overrideredirect(True)  # Remove title bar
+                
+                # Orange background
+                notif.config(bg='#FF9800')
+                
+                # Add label
+                self._notif_label = ttk.Label(
+                    notif,
+                    background='#FF9800',
+                    foreground='white',
+                    font=('Segoe UI', 10, 'bold'),
+                    padding=15
+                )
+                self._notif_label.pack()
+                self._notif = notif
+            elif self._notif_after_id is not None:
+                # Still showing a previous message: drop its pending hide
+                notif.after_cancel(self._notif_after_id)
+                self._notif_after_id = None
+
+            self._notif_label.configure(text=message)
             notif.update_idletasks()
             
             # Position at bottom right of GUI window (not screen)
@@ -1611,21 +2093,31 @@ class ModernTTKApp:
             root_width = self.root.winfo_width()
             root_height = self.root.winfo_height()
             
-            notif_width = notif.winfo_width()
-            notif_height = notif.winfo_height()
+            notif_width = notif.winfo_reqwidth()
+            notif_height = notif.winfo_reqheight()
             
             # Calculate position relative to GUI window
             x = root_x + root_width - notif_width - 15
             y = root_y + root_height - notif_height - 15
             
             notif.geometry(f'+{x}+{y}')
+            notif.deiconify()
+            notif.lift()
             
-            # Auto close after duration
-            notif.after(duration, notif.destroy)
+            # Auto hide after duration
+            self._notif_after_id = notif.after(duration, self._hide_notification)
             
         except Exception as e:
             self.log_message(f"⚠️ Bildirim gösterme hatası: {e}")
 
+    def _hide_notification(self):
+        self._notif_after_id = None
+        try:
+            if self._notif is not None:
+                self._notif.withdraw()
+        except Exception:
+            pass
+
     def _auto_browse_input(self):
         """Auto-open file dialog and set input file."""
         path = filedialog.askopenfilename(
@@ -1637,7 +2129,7 @@ class ModernTTKApp:
             self.in_var.set(path)
             self.log_message(f"📂 Giriş: {path}")
             # PDF seçildiğinde arka plan şablonunu oluştur
-            threading.Thread(target=self._generate_template_from_pdf, args=(path,), daemon=True).start()
+            self._request_template(path)
             try:
                 p = Path(path)
                 if not self.out_var.get():
@@ -1681,22 +2173,16 @@ class ModernTTKApp:
             self._show_notification("🔑 PKCS#11 DLL seçimi gerekli")
             return
 
+        self._ensure_visual_stamp()
+
         from types import SimpleNamespace
         args = SimpleNamespace(
-            pkcs11_lib=self.pkcs11_var.get(),
-            pin=self.pin_var.get(),
-            cert_label=None,
-            key_label=None,
             in_path=self.in_var.get(),
             out_path=self.out_var.get(),
-            reason=self._get_entry_value(self.reason_entry, getattr(self, 'reason_placeholder', None)),
-            location=self._get_entry_value(self.location_entry, getattr(self, 'location_placeholder', None)),
             compress_pdf=self.compress_pdf_var.get(),
-            ltv_enabled=self.ltv_var.get(),
-            tsa_url=self.default_tsa_url if getattr(self, 'tsa_enabled_var', None) and self.tsa_enabled_var.get() else '',
-            docmdp_mode=self._docmdp_map.get(self.docmdp_var.get(), 'signing_only') if getattr(self, '_docmdp_map', None) else 'signing_only',
             visual_stamp_path=str(TEMP_DIR / "gui_preview_sig.png"),
-            multi_sig_mode=self.multi_sig_var.get()
+            multi_sig_mode=self.multi_sig_var.get(),
+            **self._signing_options()
         )
 
         self.log_message("✍️ İmzalama işlemi başlatılıyor...")
@@ -1707,50 +2193,80 @@ class ModernTTKApp:
 
         # show progress modal
         self._show_progress_modal()
-        try:
-            selected_display = self._cert_combo_var.get()
-            if selected_display and selected_display != '(none)':
-                cert_label = self._cert_map.get(selected_display, {}).get('cert_label')
-                if not cert_label:
-                    cert_label = selected_display.split('|')[0].strip()
-                args.cert_label = cert_label
-        except Exception:
-            pass
+
+        def unlock_ui():
+            self.auth_sign_btn.configure(state="normal")
+            self._close_progress_modal()
 
         def worker():
             try:
-                from sign_pdf import sign_cmd
                 sign_cmd(args, gui_logger=self.log_message)
+                # Unlock the UI before handing the file to the viewer
+                self._ui_queue.put(unlock_ui)
                 try:
                     if args.out_path and os.path.exists(args.out_path):
                         self.log_message(f"📂 Dosya açılıyor: {args.out_path}")
-                        try:
-                            os.startfile(args.out_path)
-                        except Exception as open_err:
-                            self.log_message(f"⚠️ Dosya açma hatası: {open_err}")
-                            # Fallback to webbrowser
-                            try:
-                                import webbrowser
-                                webbrowser.open(args.out_path)
-                            except Exception as wb_err:
-                                self.log_message(f"⚠️ Fallback hatası: {wb_err}")
+                        self._open_file_detached(str(args.out_path))
                 except Exception as e:
                      self.log_message(f"⚠️ Dosya yolu hatası: {e}")
             except Exception as exc:
                 if isinstance(exc, PermissionError):
                     msg = str(exc) or "Çıkış dosyası başka bir program tarafından açık. Lütfen kapatıp tekrar deneyin."
-                    self.root.after(0, lambda m=msg: messagebox.showwarning("Dosya açık", m))
-                    self.root.after(0, lambda m=msg: self.log_message(f"⚠️ {m}"))
+                    self._ui_queue.put(lambda m=msg: messagebox.showwarning("Dosya açık", m))
+                    self._ui_queue.put(f"⚠️ {msg}")
                 else:
                     msg = str(exc)
-                    self.root.after(0, lambda m=msg: messagebox.showerror("İmza hatası", m))
-                    self.root.after(0, lambda m=msg: self.log_message(f"⚠️ Hata: {m}"))
+                    self._ui_queue.put(lambda m=msg: messagebox.showerror("İmza hatası", m))
+                    self._ui_queue.put(f"⚠️ Hata: {msg}")
             finally:
-                self.root.after(0, lambda: self.auth_sign_btn.configure(state="normal"))
-                self.root.after(0, self._close_progress_modal)
+                self._ui_queue.put(unlock_ui)
 
         threading.Thread(target=worker, daemon=True).start()
 
+    def _selected_cert_label(self):
+        """Return the PKCS#11 label of the selected certificate, or None."""
+        try:
+            selected_display = self._cert_combo_var.get()
+            if not selected_display or selected_display == '(none)':
+                return None
+            cert_label = self._cert_map.get(selected_display, {}).get('cert_label')
+            return cert_label or selected_display.split('|')[0].strip()
+        except Exception:
+            return None
+
+    def _signing_options(self):
+        """Read the sign_cmd options shared by single and batch signing (Tk thread)."""
+        return dict(
+            pkcs11_lib=self.pkcs11_var.get(),
+            pin=self.pin_var.get(),
+            cert_label=self._selected_cert_label(),
+            key_label=None,
+            reason=self._get_entry_value(self.reason_entry, getattr(self, 'reason_placeholder', None)),
+            location=self._get_entry_value(self.location_entry, getattr(self, 'location_placeholder', None)),
+            ltv_enabled=self.ltv_var.get(),
+            tsa_url=self.default_tsa_url if self.tsa_enabled_var.get() else '',
+            docmdp_mode=self._docmdp_map.get(self.docmdp_var.get(), 'signing_only'),
+        )
+
+    def _open_file_detached(self, path):
+        """Open path with the default viewer without blocking the caller.
+
+        os.startfile can take seconds while the viewer cold-starts, so it runs
+        in its own daemon thread (webbrowser is the fallback).
+        """
+        def opener():
+            try:
+                os.startfile(path)
+            except Exception as open_err:
+                self.log_message(f"⚠️ Dosya açma hatası: {open_err}")
+                # Fallback to webbrowser
+                try:
+                    webbrowser.open(path)
+                except Exception as wb_err:
+                    self.log_message(f"⚠️ Fallback hatası: {wb_err}")
+
+        threading.Thread(target=opener, daemon=True).start()
+
     def do_batch_sign(self):
         """Batch sign all PDF files in the same directory as the selected input file."""
         # Auto-action: Browse for input if not selected
@@ -1783,7 +2299,7 @@ class ModernTTKApp:
         directory = selected_file.parent
         
         # Find all PDF files in the directory (including selected file)
-        pdf_files = list(directory.glob("*.pdf"))
+        pdf_files = [directory / name for name in self._list_pdf_names(directory)]
         # Note: Selected file is included in the batch
         
         if not pdf_files:
@@ -1791,9 +2307,11 @@ class ModernTTKApp:
             return
 
         # Show confirmation dialog
-        file_list = "\n".join(f"• {f.name}" for f in pdf_files[:10])  # Show first 10 files
+        # Show the first 10 files only; never format every entry
+        preview = [f"• {f.name}" for f in pdf_files[:10]]
         if len(pdf_files) > 10:
-            file_list += f"\n... ve {len(pdf_files) - 10} dosya daha"
+            preview.append(f"... ve {len(pdf_files) - 10} dosya daha")
+        file_list = "\n".join(preview)
         
         confirm_msg = f"""Toplu imzalama işlemi başlatılacak.
 
@@ -1809,14 +2327,6 @@ Devam etmek istiyor musunuz?"""
         if not messagebox.askyesno("Toplu İmza Onayı", confirm_msg):
             return
 
-        # Get certificate selection
-        selected_display = self._cert_combo_var.get()
-        cert_label = None
-        if selected_display and selected_display != '(none)':
-            cert_label = self._cert_map.get(selected_display, {}).get('cert_label')
-            if not cert_label:
-                cert_label = selected_display.split('|')[0].strip()
-
         self.log_message(f"📝 Toplu imzalama başlatılıyor... ({len(pdf_files)} dosya)")
         
         # Disable buttons
@@ -1829,68 +2339,100 @@ Devam etmek istiyor musunuz?"""
         # Show progress modal
         self._show_progress_modal()
 
+        # Options shared by every file, read once on the Tk thread
+        common = self._signing_options()
+        pkcs11_path = common['pkcs11_lib']
+        pin = common['pin']
+        signed_dir = directory / "imzalananlar"
+        # Process pool (one token login per process) is opt-in: not every
+        # PKCS#11 middleware allows concurrent sessions from several processes
+        try:
+            use_processes = bool(self.config.get('signing', {}).get('batch_use_processes', False))
+        except Exception:
+            use_processes = False
+
+        def unlock_ui():
+            self.auth_sign_btn.configure(state="normal")
+            self.batch_sign_btn.configure(state="normal")
+            self._close_progress_modal()
+
         def batch_worker():
             try:
-                from sign_pdf import sign_cmd
                 from types import SimpleNamespace
                 
                 success_count = 0
                 error_count = 0
-                
-                for i, pdf_file in enumerate(pdf_files, 1):
-                    try:
-                        # Update progress
-                        progress_msg = f"İmzalanıyor: {pdf_file.name} ({i}/{len(pdf_files)})"
-                        self.root.after(0, lambda m=progress_msg: self.log_message(f"📝 {m}"))
-                        
-                        # Create output path in "imzalananlar" subdirectory
-                        signed_dir = pdf_file.parent / "imzalananlar"
-                        signed_dir.mkdir(exist_ok=True)
-                        output_file = signed_dir / f"{pdf_file.name}"  # Use original filename
-                        
-                        # Create args for this file
-                        args = SimpleNamespace(
-                            pkcs11_lib=self.pkcs11_var.get(),
-                            pin=self.pin_var.get(),
-                            cert_label=cert_label,
-                            key_label=None,
-                            in_path=str(pdf_file),
-                            out_path=str(output_file),
-                            reason=self._get_entry_value(self.reason_entry, getattr(self, 'reason_placeholder', None)),
-                            location=self._get_entry_value(self.location_entry, getattr(self, 'location_placeholder', None)),
-                            ltv_enabled=self.ltv_var.get(),
-                            tsa_url=self.default_tsa_url if getattr(self, 'tsa_enabled_var', None) and self.tsa_enabled_var.get() else '',
-                            docmdp_mode=self._docmdp_map.get(self.docmdp_var.get(), 'signing_only') if getattr(self, '_docmdp_map', None) else 'signing_only'
-                        )
-                        
-                        # Sign the file
-                        sign_cmd(args, gui_logger=None)  # Don't log individual file messages
+                signed_dir.mkdir(exist_ok=True)
+
+                # Output goes to the "imzalananlar" subdirectory, original filename
+                jobs = (
+                    SimpleNamespace(in_path=str(pdf_file), out_path=str(signed_dir / pdf_file.name), **common)
+                    for pdf_file in pdf_files
+                )
+                workers = min(BATCH_SIGN_MAX_WORKERS, os.cpu_count() or 1, len(pdf_files))
+
+                # One PKCS#11 login for the whole batch; files are processed in
+                # parallel and reported as they finish
+                done = 0
+                for args, exc in sign_many(pkcs11_path, pin, jobs, gui_logger=None, max_workers=workers,
+                                             use_processes=use_processes):  # Don't log individual file messages
+                    done += 1
+                    # sign_cmd may swap in_path for a compressed copy; out_path keeps the name
+                    name = Path(args.out_path).name
+                    if exc is None:
+                        progress_msg = f"İmzalandı: {name} ({done}/{len(pdf_files)})"
+                        self._ui_queue.put(f"📝 {progress_msg}")
                         success_count += 1
-                        
-                    except Exception as exc:
-                        error_msg = f"Hata ({pdf_file.name}): {str(exc)}"
-                        self.root.after(0, lambda m=error_msg: self.log_message(f"⚠️ {m}"))
+                    else:
+                        error_msg = f"Hata ({name}): {str(exc)}"
+                        self._ui_queue.put(f"⚠️ {error_msg}")
                         error_count += 1
                 
                 # Final report - Show result window with folder open button
-                self.root.after(0, lambda: self._show_batch_sign_result(success_count, error_count, signed_dir))
+                self._ui_queue.put(lambda: self._show_batch_sign_result(success_count, error_count, signed_dir))
                 
             except Exception as exc:
                 msg = str(exc)
-                self.root.after(0, lambda m=msg: messagebox.showerror("Toplu İmza Hatası", m))
-                self.root.after(0, lambda m=msg: self.log_message(f"⚠️ Genel hata: {m}"))
+                self._ui_queue.put(lambda m=msg: messagebox.showerror("Toplu İmza Hatası", m))
+                self._ui_queue.put(f"⚠️ Genel hata: {msg}")
             finally:
                 # Re-enable buttons
-                self.root.after(0, lambda: self.auth_sign_btn.configure(state="normal"))
-                self.root.after(0, lambda: self.batch_sign_btn.configure(state="normal"))
-                self.root.after(0, self._close_progress_modal)
+                self._ui_queue.put(unlock_ui)
 
         threading.Thread(target=batch_worker, daemon=True).start()
 
+    def _list_pdf_names(self, directory):
+        """Return the names of the *.pdf files directly inside directory.
+
+        Uses a single os.scandir pass (no per-entry Path objects) and is
+        memoized per directory on its mtime, so reopening the batch dialog
+        on an unchanged folder does not list it again.
+        """
+        key = os.fspath(directory)
+        try:
+            mtime = os.stat(key).st_mtime_ns
+        except OSError:
+            return ()
+        cached = self._pdf_list_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        names = []
+        with os.scandir(key) as it:
+            for entry in it:
+                try:
+                    if entry.name.lower().endswith('.pdf') and entry.is_file():
+                        names.append(entry.name)
+                except OSError:
+                    continue
+        names = tuple(names)
+        self._pdf_list_cache[key] = (mtime, names)
+        return names
+
     def _show_batch_sign_result(self, success_count, error_count, signed_dir):
         """Show batch signing result with professional styling matching flatly theme."""
         try:
             import subprocess
+            import sys
             from tkinter import Frame, Label, Button
             
             # Flatly theme colors
@@ -2006,9 +2548,15 @@ Devam etmek istiyor musunuz?"""
             def open_folder():
                 try:
                     if os.name == 'nt':  # Windows
-                        subprocess.Popen(f'explorer "{signed_dir}"')
-                    elif os.name == 'posix':  # macOS/Linux
-                        subprocess.Popen(['open', str(signed_dir)])
+                        cmd = ['explorer', str(signed_dir)]
+                    elif sys.platform == 'darwin':  # macOS
+                        cmd = ['open', str(signed_dir)]
+                    else:  # Linux
+                        cmd = ['xdg-open', str(signed_dir)]
+                    # List form (no shell quoting); our fds are non-inheritable
+                    # (PEP 446), so close_fds=False just skips the close sweep
+                    subprocess.Popen(cmd, close_fds=False, stdin=subprocess.DEVNULL,
+                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                     result_win.destroy()
                 except Exception as e:
                     self.log_message(f"⚠️ Klasör açılırken hata: {e}")
@@ -2068,12 +2616,12 @@ Devam etmek istiyor musunuz?"""
         path = self.pkcs11_var.get()
         if not path:
             return
-        self.root.after(0, lambda: self.log_message(f"🔍 Loading PKCS#11 module: {path}"))
+        self._ui_queue.put(f"🔍 Loading PKCS#11 module: {path}")
         try:
             lib = load_pkcs11_lib(path)
         except Exception as exc:
             msg = str(exc)
-            self.root.after(0, lambda m=msg: self.log_message(f"⚠️ DLL yüklenemedi: {m}"))
+            self._ui_queue.put(f"⚠️ DLL yüklenemedi: {msg}")
             return
         options = []
         slot_map = {}
@@ -2086,19 +2634,22 @@ Devam etmek istiyor musunuz?"""
                         token = slot.get_token()
                     except Exception:
                         token = None
-                    label = (getattr(token, 'label', None) or '<unknown>').strip()
-                    display = f"{slot.slot_id}: {label}"
+                    # Read each token attribute once
+                    slot_id = slot.slot_id
+                    raw_label = getattr(token, 'label', None)
+                    serial = getattr(token, 'serial', None)
+                    display = f"{slot_id}: {(raw_label or '<unknown>').strip()}"
                     options.append(display)
-                    slot_map[display] = {'slot_id': slot.slot_id, 'serial': getattr(token, 'serial_number', None), 'label': getattr(token, 'label', None)}
+                    slot_map[display] = {'slot_id': slot_id, 'serial': serial, 'label': raw_label}
                 break
             except Exception as exc:
                 msg = str(exc)
                 if 'initiali' in msg.lower() and attempt + 1 < attempts:
-                    self.root.after(0, lambda m=msg: self.log_message(f"⚠️ Token listesi hatası (yeniden deneniyor): {m}"))
+                    self._ui_queue.put(f"⚠️ Token listesi hatası (yeniden deneniyor): {msg}")
                     import time
                     time.sleep(0.45)
                     continue
-                self.root.after(0, lambda m=msg: self.log_message(f"⚠️ Token listesi okunamadı: {m}"))
+                self._ui_queue.put(f"⚠️ Token listesi okunamadı: {msg}")
                 break
         if not options:
             options = ['(none)']
@@ -2116,7 +2667,7 @@ Devam etmek istiyor musunuz?"""
                 threading.Thread(target=self._on_token_change, args=(self._token_combo_var.get(),), daemon=True).start()
             except Exception:
                 pass
-        self.root.after(0, apply)
+        self._ui_queue.put(apply)
 
     def _on_token_change(self, value):
         slot_info = self._slot_map.get(value)
@@ -2137,24 +2688,11 @@ Devam etmek istiyor musunuz?"""
             pass
 
     def _refresh_certs_for_slot(self, slot_info):
-        def get_cn_from_subject(subject_str):
-            try:
-                # Find CN= part, split by comma, and return the value
-                parts = subject_str.split(',')
-                for part in parts:
-                    part = part.strip()
-                    if part.upper().startswith('CN='):
-                        return part[3:]
-                # Fallback if CN is not found but subject exists
-                return subject_str.split(',')[0]
-            except Exception:
-                return subject_str  # Return original string on any error
-
         try:
             lib = load_pkcs11_lib(self.pkcs11_var.get())
         except Exception as exc:
             msg = str(exc)
-            self.root.after(0, lambda m=msg: self.log_message(f"⚠️ DLL yüklenemedi: {m}"))
+            self._ui_queue.put(f"⚠️ DLL yüklenemedi: {msg}")
             return
         certs = []
         cert_map = {}
@@ -2169,7 +2707,7 @@ Devam etmek istiyor musunuz?"""
                 if s.slot_id == slot_info.get('slot_id'):
                     target_slot = s
                     break
-                if t is not None and slot_info.get('serial') and getattr(t, 'serial_number', None) == slot_info.get('serial'):
+                if t is not None and slot_info.get('serial') and getattr(t, 'serial', None) == slot_info.get('serial'):
                     target_slot = s
                     break
                 if t is not None and slot_info.get('label') and (t.label or '').strip() == (slot_info.get('label') or '').strip():
@@ -2177,37 +2715,34 @@ Devam etmek istiyor musunuz?"""
                     break
         except Exception as exc:
             msg = str(exc)
-            self.root.after(0, lambda m=msg: self.log_message(f"⚠️ Slot arama hatası: {m}"))
+            self._ui_queue.put(f"⚠️ Slot arama hatası: {msg}")
             return
 
         if not target_slot:
-            self.root.after(0, lambda: self.log_message('⚠️ Seçilen token bulunamadı (farklı lib örneği).'))
+            self._ui_queue.put('⚠️ Seçilen token bulunamadı (farklı lib örneği).')
             return
 
         attempts = 2
         for attempt in range(attempts):
             try:
                 for s, token, label, subject, issuer, serial in list_certs(lib, slot=target_slot):
-                    display = get_cn_from_subject(subject or '<no subject>')
+                    subject_str = subject or '<no subject>'
+                    # Fallback to the first RDN if the subject has no CN
+                    display = _subject_cn(subject_str) or subject_str.split(',', 1)[0]
                     certs.append(display)
-                    cert_map[display] = {
-                        'cert_label': label,
-                        'subject': subject,
-                        'issuer': issuer,
-                        'token_label': token.label,
-                        'slot_id': target_slot.slot_id,
-                        'serial': serial
-                    }
+                    cert_map[display] = _CertInfo(
+                        target_slot.slot_id, token.label, label, subject, issuer, serial
+                    )
                 break
             except Exception as exc:
                 msg = str(exc)
                 if 'initiali' in msg.lower() and attempt + 1 < attempts:
-                    self.root.after(0, lambda m=msg: self.log_message(f"⚠️ Sertifika okuma hatası (yeniden deneniyor): {m}"))
+                    self._ui_queue.put(f"⚠️ Sertifika okuma hatası (yeniden deneniyor): {msg}")
                     import time
                     time.sleep(0.45)
                     continue
                 else:
-                    self.root.after(0, lambda m=msg: self.log_message(f"⚠️ Sertifika okunamadı: {m}"))
+                    self._ui_queue.put(f"⚠️ Sertifika okunamadı: {msg}")
                     break
         if not certs:
             certs = ['(none)']
@@ -2225,7 +2760,7 @@ Devam etmek istiyor musunuz?"""
                 self._show_signature_preview(silent=True)
             except Exception:
                 pass
-        self.root.after(0, apply)
+        self._ui_queue.put(apply)
 
     def show_cert_details(self):
         sel = self._cert_combo_var.get()
@@ -2257,16 +2792,16 @@ Devam etmek istiyor musunuz?"""
         try:
             defaults = DEFAULT_SIGNATURE_SETTINGS
             # numeric defaults
-            self.sig_width_var.set(str(defaults.get('width_mm', 15.0)))
-            self.sig_logo_width_var.set(str(defaults.get('logo_width_mm', 20.0)))
-            self.sig_margin_x_var.set(str(defaults.get('margin_x_mm', 12.0)))
-            self.sig_margin_y_var.set(str(defaults.get('margin_y_mm', 25.0)))
+            self.sig_width_var.set(str(defaults.width_mm))
+            self.sig_logo_width_var.set(str(defaults.logo_width_mm))
+            self.sig_margin_x_var.set(str(defaults.margin_x_mm))
+            self.sig_margin_y_var.set(str(defaults.margin_y_mm))
             # placement default display string
-            placement_code = defaults.get('placement', DEFAULT_SIGNATURE_SETTINGS['placement'])
-            placement_display = next((d for c, d in PLACEMENT_OPTIONS if c == placement_code), placement_code)
+            placement_code = defaults.placement
+            placement_display = PLACEMENT_LABEL_BY_CODE.get(placement_code, placement_code)
             self.sig_placement_var.set(placement_display)
-            self.sig_font_var.set(defaults.get('font_family', 'Segoe'))
-            self.sig_style_var.set(defaults.get('font_style', 'Bold'))
+            self.sig_font_var.set(defaults.font_family)
+            self.sig_style_var.set(defaults.font_style)
             # force immediate save and refresh
             try:
                 self._auto_save_signature_settings()
@@ -2278,9 +2813,7 @@ Devam etmek istiyor musunuz?"""
             self.log_message(f'⚠️ Sıfırlama başarısız: {exc}')
 
     def _show_signature_preview(self, silent=False):
-        try:
-            from PIL import Image as PILImage
-        except ImportError:
+        if _get_pil()[0] is None:
             self.log_message("⚠️ Önizleme için 'Pillow' kütüphanesi gerekli. Lütfen kurun: pip install Pillow")
             if not silent:
                 messagebox.showerror("Hata", "Önizleme için 'Pillow' kütüphanesi gerekli.")
@@ -2289,6 +2822,12 @@ Devam etmek istiyor musunuz?"""
         # Önizleme penceresi açılmadan önce bilgilerin güncel olduğundan emin olalım
         self._update_signature_image_display()
 
+        # Silent refreshes with unchanged inputs have nothing new to draw
+        key = self._preview_input_key()
+        if silent and key is not None and key == self._preview_drawn_key:
+            return
+        self._preview_drawn_key = key
+
         # Sol paneldeki gömülü önizlemeyi güncelle (Daha iyi sığması için ölçek 1.18 yapıldı)
         self._draw_preview_on_canvas(self.embedded_canvas, scale=1.35, silent=True)
 
@@ -2298,7 +2837,7 @@ Devam etmek istiyor musunuz?"""
 
         # --- Constants ---
         A4_W_MM, A4_H_MM = 210, 297
-        SCALE = 2.5  # Daha gerçekçi bir görünüm için ölçek artırıldı
+        SCALE = _PREVIEW_WIN_SCALE  # Daha gerçekçi bir görünüm için ölçek artırıldı
         CANVAS_W, CANVAS_H = int(A4_W_MM * SCALE), int(A4_H_MM * SCALE)
         PAGE_COLOR = "white"
         SIG_BOX_COLOR = "red"
@@ -2355,6 +2894,269 @@ Devam etmek istiyor musunuz?"""
         if hasattr(self, '_preview_canvas') and self._preview_canvas:
             self._draw_preview_on_canvas(self._preview_canvas, scale=SCALE, silent=silent)
 
+    _IMAGE_CACHE_SIZE = 16
+
+    def _cached_image(self, key, builder):
+        """Return the cached value for key, building (and caching) it on a miss.
+
+        Holds PIL images and PhotoImages for the preview in a bounded LRU so
+        toggling between settings doesn't re-render or re-upload bitmaps.
+        Failed builds (None, or a tuple whose first item is None) are not cached.
+        """
+        cache = self._image_cache
+        try:
+            value = cache[key]
+            cache.move_to_end(key)
+            return value
+        except KeyError:
+            pass
+        value = builder()
+        if value is not None and not (isinstance(value, tuple) and value[0] is None):
+            cache[key] = value
+            while len(cache) > self._IMAGE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return value
+
+    def _read_sig_inputs(self):
+        """Read and parse the signature settings from the UI variables.
+
+        Returns (font_size_mm, logo_width_mm, margin_x_mm, margin_y_mm,
+        placement, font_family, font_style); raises ValueError on bad input.
+        """
+        return (
+            float(self.sig_width_var.get() or 0),
+            float(self.sig_logo_width_var.get() or 0),
+            float(self.sig_margin_x_var.get() or 0),
+            float(self.sig_margin_y_var.get() or 0),
+            self._placement_map.get(self.sig_placement_var.get(), 'top-right'),
+            self.sig_font_var.get(),
+            self.sig_style_var.get(),
+        )
+
+    def _signature_logo_path(self):
+        """Custom signature image from config if it exists, else the bundled logo."""
+        try:
+            custom_path = self.config.get('signature', {}).get('image_path')
+        except Exception:
+            custom_path = None
+        return _resolve_logo_path(custom_path or None)
+
+    def _preview_background_path(self):
+        # With the PDF preview off, dynamic_sablon.png may still hold an
+        # earlier document's page; use the static template instead
+        try:
+            use_dynamic = self.pdf_preview_var.get()
+        except Exception:
+            use_dynamic = True
+        dynamic_path = TEMP_DIR / 'dynamic_sablon.png'
+        if use_dynamic and dynamic_path.exists():
+            return dynamic_path
+        return resource_path('sablon.pdf')
+
+    def _sig_image_request(self, logo_path, signer_lines, font_size_mm, logo_width_mm, font_family, font_style):
+        """Return (cache_key, builder) for the combined signature image.
+
+        The builder is pure PIL (no Tk calls) and may run on a worker thread.
+        """
+        logo_str = str(logo_path)
+        key = ('sig', logo_str, tuple(signer_lines), font_size_mm, logo_width_mm, font_family, font_style)
+
+        def build():
+            return create_combined_signature_image(
+                logo_imza_path=logo_str,
+                signer_lines=signer_lines,
+                font_size_mm=font_size_mm,
+                logo_width_mm=logo_width_mm,
+                preview_mode=True,
+                font_family=font_family,
+                font_style=font_style
+            )
+        return key, build
+
+    def _bg_image_request(self, bg_path, scale):
+        """Return (cache_key, builder) for the page background at a preview scale.
+
+        The builder is pure PIL/PyMuPDF (no Tk calls) and may run on a worker thread.
+        """
+        PILImage = _get_pil()[0]
+        canvas_w, canvas_h = int(210 * scale), int(297 * scale)
+        key = ('bg', str(bg_path), scale, bg_path.stat().st_mtime if bg_path.exists() else 0)
+
+        def build():
+            is_pdf = bg_path.suffix.lower() == '.pdf'
+            if is_pdf:
+                # Rasterized page kept on disk across runs (TEMP_DIR is wiped at
+                # startup); valid while it is newer than the PDF
+                cache_png = CONFIG_DIR / 'cache' / f"{bg_path.stem}_{canvas_w}x{canvas_h}.png"
+                try:
+                    if cache_png.stat().st_mtime >= bg_path.stat().st_mtime:
+                        img = PILImage.open(cache_png)
+                        img.load()
+                        return img
+                except OSError:
+                    pass
+            fitz = _get_fitz() if is_pdf else None
+            if fitz:
+                # PDF dosyasını görüntüye dönüştür (PyMuPDF ile)
+                # Rasterize straight at the canvas size and wrap the raw RGB
+                # samples (no PNG encode/decode round-trip, no resample)
+                with fitz.open(str(bg_path)) as pdf_doc:
+                    if pdf_doc.page_count == 0:
+                        raise ValueError("PDF boş")
+                    page = pdf_doc[0]
+                    matrix = fitz.Matrix(canvas_w / page.rect.width, canvas_h / page.rect.height)
+                    pix = page.get_pixmap(matrix=matrix, alpha=False)
+                    img = PILImage.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", 0, 1)
+                try:
+                    cache_png.parent.mkdir(parents=True, exist_ok=True)
+                    img.save(cache_png)
+                except OSError:
+                    pass
+            else:
+                img = PILImage.open(bg_path)
+            if img.size == (canvas_w, canvas_h):
+                return img
+            return img.resize((canvas_w, canvas_h), PILImage.LANCZOS)
+        return key, build
+
+    def _prerender_preview_async(self, scale=1.35):
+        """Render the embedded preview's bitmaps on a worker thread.
+
+        A plain page outline is drawn immediately so the canvas isn't blank;
+        the signature and background images are built off the Tk thread, put
+        into the image cache, and the real preview is then drawn from cache.
+        """
+        if _get_pil()[0] is None:
+            return
+        try:
+            canvas = self.embedded_canvas
+            w, h = int(210 * scale), int(297 * scale)
+            canvas.configure(width=w, height=h)
+            canvas.delete("all")
+            self._canvas_layers.pop(canvas, None)
+            canvas.create_rectangle(0, 0, w - 1, h - 1, fill="white", outline="gray")
+        except Exception:
+            pass
+
+        requests = []
+        try:
+            self._update_signature_image_display()
+            font_size_mm, logo_width_mm, _, _, _, font_family, font_style = self._read_sig_inputs()
+            info_text = self.sig_info_text_label.cget("text")
+            signer_lines = info_text.split('\n') if info_text else []
+            requests.append(self._sig_image_request(
+                self._signature_logo_path(), signer_lines, font_size_mm, logo_width_mm, font_family, font_style))
+            bg_path = self._preview_background_path()
+            if bg_path.exists():
+                requests.append(self._bg_image_request(bg_path, scale))
+        except Exception:
+            pass
+        requests = [(key, build) for key, build in requests if key not in self._image_cache]
+
+        def worker():
+            results = []
+            for key, build in requests:
+                try:
+                    results.append((key, build()))
+                except Exception:
+                    pass
+            self._ui_queue.put(lambda: self._finish_prerender(results))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _write_sig_png(self, key, img):
+        """Write img to gui_preview_sig.png unless it already holds key's render.
+
+        Signing uses this file as the visual stamp, so keep it in sync with
+        the settings even when the image came from the cache.
+        """
+        if self._sig_png_key == key and (TEMP_DIR / "gui_preview_sig.png").exists():
+            return
+        try:
+            img.save(TEMP_DIR / "gui_preview_sig.png")
+            self._sig_png_key = key
+        except Exception:
+            pass
+
+    def _ensure_visual_stamp(self):
+        """Bring gui_preview_sig.png up to date before signing (Tk thread).
+
+        Redraws build a changed signature off the Tk thread, so right after an
+        edit the file can still hold the previous stamp; build it inline here
+        (a cache hit once the background build has landed).
+        """
+        try:
+            font_size_mm, logo_width_mm, _, _, _, font_family, font_style = self._read_sig_inputs()
+            info_text = self.sig_info_text_label.cget("text")
+            signer_lines = info_text.split('\n') if info_text else []
+            key, build = self._sig_image_request(
+                self._signature_logo_path(), signer_lines, font_size_mm, logo_width_mm, font_family, font_style)
+            combined_img = (self._cached_image(key, build) or (None, 0))[0]
+            if combined_img:
+                self._write_sig_png(key, combined_img)
+        except Exception:
+            pass
+
+    def _build_sig_image_async(self, key, build):
+        """Build the combined signature image on a worker thread.
+
+        The result comes back through `_ui_queue`; only the latest request
+        (by generation) triggers a redraw, older ones just fill the cache.
+        """
+        self._sig_build_gen += 1
+        gen = self._sig_build_gen
+        self._sig_build_key = key
+        self._sig_build_pending = True
+
+        def worker():
+            try:
+                value = build()
+            except Exception:
+                value = None
+            self._ui_queue.put(lambda: self._on_sig_image_ready(gen, key, value))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_sig_image_ready(self, gen, key, value):
+        self._cached_image(key, lambda: value)
+        if gen != self._sig_build_gen:
+            return
+        self._sig_build_pending = False
+        try:
+            self._draw_preview_on_canvas(self.embedded_canvas, scale=1.35, silent=True)
+            preview = getattr(self, '_preview_canvas', None)
+            if preview is not None and self._preview_win.winfo_exists():
+                self._draw_preview_on_canvas(preview, scale=_PREVIEW_WIN_SCALE, silent=True)
+        except Exception:
+            pass
+
+    def _finish_prerender(self, results):
+        for key, value in results:
+            self._cached_image(key, lambda v=value: v)
+        self._show_signature_preview(silent=True)
+
+    def _preview_input_key(self):
+        """Snapshot of everything the preview drawing depends on (None if unreadable)."""
+        try:
+            dynamic_path = TEMP_DIR / 'dynamic_sablon.png'
+            try:
+                bg_mtime = dynamic_path.stat().st_mtime
+            except OSError:
+                bg_mtime = None
+            preview_open = bool(getattr(self, '_preview_win', None) and self._preview_win.winfo_exists())
+            return (
+                self.sig_width_var.get(), self.sig_logo_width_var.get(),
+                self.sig_margin_x_var.get(), self.sig_margin_y_var.get(),
+                self.sig_placement_var.get(), self.sig_font_var.get(), self.sig_style_var.get(),
+                self.sig_info_text_label.cget("text"),
+                # (path, mtime) of the signature image, refreshed by
+                # _update_signature_image_display just before this is read
+                self.config.get('signature', {}).get('image_path'), self._sig_thumb_key,
+                bg_mtime, preview_open,
+            )
+        except Exception:
+            return None
+
     def _draw_preview_on_canvas(self, canvas, scale, silent=False):
         """Helper to draw the A4 page and signature preview on a specific canvas.
         
@@ -2366,7 +3168,8 @@ Devam etmek istiyor musunuz?"""
         """
         if not canvas:
             return
-            
+
+        PILImage, ImageTk = _get_pil()
         if PILImage is None:
             return
 
@@ -2379,14 +3182,8 @@ Devam etmek istiyor musunuz?"""
 
         # --- Get values from UI ---
         try:
-            font_size_mm = float(self.sig_width_var.get() or 0)
-            logo_width_mm = float(self.sig_logo_width_var.get() or 0)
-            margin_x_mm = float(self.sig_margin_x_var.get() or 0)
-            margin_y_mm = float(self.sig_margin_y_var.get() or 0)
-            placement_display = self.sig_placement_var.get()
-            placement = self._placement_map.get(placement_display, 'top-right')
-            font_family = self.sig_font_var.get()
-            font_style = self.sig_style_var.get()
+            (font_size_mm, logo_width_mm, margin_x_mm, margin_y_mm,
+             placement, font_family, font_style) = self._read_sig_inputs()
         except (ValueError, AttributeError) as e:
             if not silent:
                 self.log_message(f"⚠️ Geçersiz imza ayar değeri: {e}")
@@ -2398,37 +3195,25 @@ Devam etmek istiyor musunuz?"""
         signer_lines = info_text.split('\n') if info_text else []
         
         # Get logo path
-        try:
-            custom_path = self.config.get('signature', {}).get('image_path')
-            logo_path = Path(custom_path) if custom_path and Path(custom_path).exists() else resource_path('logo_imza.png')
-        except Exception:
-            logo_path = resource_path('logo_imza.png')
+        logo_path = self._signature_logo_path()
         
         # Create combined signature image for preview (matches PDF style exactly)
         # Use caching to avoid expensive re-generation when only margins change
-        cache_key = (str(logo_path), tuple(signer_lines), font_size_mm, logo_width_mm)
-        if getattr(self, '_sig_image_cache_key', None) == cache_key and getattr(self, '_sig_image_cache', None):
-            combined_img = self._sig_image_cache
-            actual_w_mm = self._sig_actual_w_mm
-        else:
-            combined_img, actual_w_mm = create_combined_signature_image(
-                logo_imza_path=str(logo_path),
-                signer_lines=signer_lines,
-                font_size_mm=font_size_mm,
-                logo_width_mm=logo_width_mm,
-                preview_mode=True,
-                font_family=font_family,
-                font_style=font_style
-            )
-            if combined_img:
-                # Cache the result for future use
-                self._sig_image_cache = combined_img
-                self._sig_image_cache_key = (str(logo_path), tuple(signer_lines), font_size_mm, logo_width_mm, font_family, font_style)
-                # Save a low-res version for reference if needed, but we use the object directly
-                try:
-                    combined_img.save(TEMP_DIR / "gui_preview_sig.png")
-                except Exception:
-                    pass
+        sig_key, build_sig = self._sig_image_request(
+            logo_path, signer_lines, font_size_mm, logo_width_mm, font_family, font_style)
+        if sig_key not in self._image_cache and canvas in self._canvas_layers:
+            # Text rendering is the slow part of a redraw: build the new
+            # signature off the Tk thread and keep the current frame until it
+            # lands. A finished build that wasn't cached (failed) is retried
+            # inline below, as before.
+            if sig_key != self._sig_build_key:
+                self._build_sig_image_async(sig_key, build_sig)
+                return
+            if self._sig_build_pending:
+                return
+        combined_img, actual_w_mm = self._cached_image(sig_key, build_sig) or (None, 0)
+        if combined_img:
+            self._write_sig_png(sig_key, combined_img)
 
         # Calculate heights for placement math
         # If combined image exists, use its aspect ratio
@@ -2461,65 +3246,74 @@ Devam etmek istiyor musunuz?"""
         else:
             x_mm = max(4.0, A4_W_MM - margin_x_mm - actual_block_w_mm)
             y_mm = margin_y_mm
-        
-        # --- Draw ---
-        canvas.configure(width=CANVAS_W, height=CANVAS_H) # Kanvas boyutunu içeriğe göre güncelle
-        canvas.delete("all")
 
-        # Arka plan şablonunu (sablon.pdf) yükle ve çiz
-        drawn_bg = False
-        try:
-            # Önce dinamik oluşturulan PDF sayfasını dene, yoksa sabit sablon.pdf'yi kullan
-            dynamic_path = TEMP_DIR / 'dynamic_sablon.png'
-            bg_path = dynamic_path if dynamic_path.exists() else resource_path('sablon.pdf')
-            
-            # Cache background image based on path and scale
-            bg_cache_key = (str(bg_path), scale, bg_path.stat().st_mtime if bg_path.exists() else 0)
-            if getattr(self, '_bg_image_cache_key', None) == bg_cache_key and getattr(self, '_bg_image_cache', None):
-                bg_img = self._bg_image_cache
-            elif bg_path.exists():
-                if bg_path.suffix.lower() == '.pdf' and fitz:
-                    # PDF dosyasını görüntüye dönüştür (PyMuPDF ile)
-                    pdf_doc = fitz.open(str(bg_path))
-                    if pdf_doc.page_count > 0:
-                        page = pdf_doc[0]
-                        zoom = 2
-                        matrix = fitz.Matrix(zoom, zoom)
-                        pix = page.get_pixmap(matrix=matrix)
-                        img_data = pix.tobytes("png")
-                        from io import BytesIO
-                        bg_img = PILImage.open(BytesIO(img_data))
-                    else:
-                        raise ValueError("PDF boş")
-                    pdf_doc.close()
-                else:
-                    bg_img = PILImage.open(bg_path)
-                
-                bg_img = bg_img.resize((CANVAS_W, CANVAS_H), PILImage.LANCZOS)
-                self._bg_image_cache = bg_img
-                self._bg_image_cache_key = bg_cache_key
-            else:
-                bg_img = None
+        x1 = x_mm * scale
+        y1 = y_mm * scale
 
-            if bg_img:
-                if canvas == self.embedded_canvas:
-                    self._embedded_bg_photo = ImageTk.PhotoImage(bg_img)
-                    canvas.create_image(0, 0, anchor=NW, image=self._embedded_bg_photo)
-                else:
-                    self._preview_bg_photo = ImageTk.PhotoImage(bg_img)
-                    canvas.create_image(0, 0, anchor=NW, image=self._preview_bg_photo)
-                # Resmin etrafına border çiz
-                canvas.create_rectangle(0, 0, CANVAS_W - 1, CANVAS_H - 1, outline="gray")
-                drawn_bg = True
+        # Önce dinamik oluşturulan PDF sayfasını dene, yoksa sabit sablon.pdf'yi kullan
+        bg_path = self._preview_background_path()
+
+        # If only the signature position changed, move its items instead of
+        # redrawing the page (the layer key covers everything else drawn)
+        try:
+            bg_layer_key = (CANVAS_W, CANVAS_H, str(bg_path),
+                            bg_path.stat().st_mtime if bg_path.exists() else 0)
+            layer_key = bg_layer_key + (sig_key, actual_block_w_mm, total_sig_height_px, logo_width_mm)
         except Exception:
-            pass
+            bg_layer_key = layer_key = None
+        # Very small signatures get a taller (invisible) drag target
+        hit_pad = max(0, _SIG_MIN_HIT_PX - total_sig_height_px) / 2
+        last = self._canvas_layers.get(canvas)
+        if layer_key is not None and last and last[0] == layer_key:
+            try:
+                # The anchor rect may have been moved by a drag, so use its real position
+                cur = canvas.coords(last[1])
+                if cur:
+                    dx, dy = x1 - cur[0], (y1 - hit_pad) - cur[1]
+                    if dx or dy:
+                        canvas.move("logo", dx, dy)
+                        canvas.move("logo_hit", dx, dy)
+                    return
+            except Exception:
+                pass
+        self._canvas_layers.pop(canvas, None)
+
+        # --- Draw ---
+        anchor_rect = None
+        if bg_layer_key is not None and last and last[2] == bg_layer_key:
+            # Same page background: keep its items (and the uploaded image),
+            # rebuild only the signature layer; the drag target is reused
+            canvas.delete("logo")
+            anchor_rect = last[1]
+        else:
+            canvas.configure(width=CANVAS_W, height=CANVAS_H) # Kanvas boyutunu içeriğe göre güncelle
+            canvas.delete("all")
 
-        if not drawn_bg:
-            # Fallback: A4 çerçevesini kendimiz çiziyoruz
-            canvas.create_rectangle(0, 0, CANVAS_W - 1, CANVAS_H - 1, fill=PAGE_COLOR, outline="gray")
+            # Arka plan şablonunu (sablon.pdf) yükle ve çiz
+            drawn_bg = False
+            try:
+                # Cache background image based on path and scale
+                bg_cache_key, build_bg = self._bg_image_request(bg_path, scale)
+                bg_img = self._cached_image(bg_cache_key, build_bg) if bg_path.exists() else None
+
+                if bg_img:
+                    bg_photo = self._cached_image(('bg_photo',) + bg_cache_key[1:], lambda: ImageTk.PhotoImage(bg_img))
+                    if canvas == self.embedded_canvas:
+                        self._embedded_bg_photo = bg_photo
+                        canvas.create_image(0, 0, anchor=NW, image=self._embedded_bg_photo)
+                    else:
+                        self._preview_bg_photo = bg_photo
+                        canvas.create_image(0, 0, anchor=NW, image=self._preview_bg_photo)
+                    # Resmin etrafına border çiz
+                    canvas.create_rectangle(0, 0, CANVAS_W - 1, CANVAS_H - 1, outline="gray")
+                    drawn_bg = True
+            except Exception:
+                pass
+
+            if not drawn_bg:
+                # Fallback: A4 çerçevesini kendimiz çiziyoruz
+                canvas.create_rectangle(0, 0, CANVAS_W - 1, CANVAS_H - 1, fill=PAGE_COLOR, outline="gray")
 
-        x1 = x_mm * scale
-        y1 = y_mm * scale
         logo_x1 = x1
         logo_x2 = x1 + actual_block_w_mm * scale
         
@@ -2527,33 +3321,39 @@ Devam etmek istiyor musunuz?"""
         try:
             if combined_img:
                 # Use the generated combined image
-                img = combined_img.copy()
                 sig_w_px = int(round(actual_block_w_mm * scale))
                 sig_h_px = int(round(total_sig_height_mm * scale))
                 
                 if sig_w_px > 0 and sig_h_px > 0:
-                    img = img.resize((sig_w_px, sig_h_px), PILImage.LANCZOS)
+                    sig_photo = self._cached_image(
+                        ('sig_photo', sig_key, sig_w_px, sig_h_px),
+                        lambda: ImageTk.PhotoImage(combined_img.resize((sig_w_px, sig_h_px), PILImage.LANCZOS)))
                     if canvas == self.embedded_canvas:
-                        self._embedded_sig_photo = ImageTk.PhotoImage(img)
+                        self._embedded_sig_photo = sig_photo
                         canvas.create_image(logo_x1, y1, anchor=NW, image=self._embedded_sig_photo, tags="logo")
                     else:
-                        self._preview_sig_photo = ImageTk.PhotoImage(img)
+                        self._preview_sig_photo = sig_photo
                         canvas.create_image(logo_x1, y1, anchor=NW, image=self._preview_sig_photo, tags="logo")
                     drawn_image = True
             elif logo_path and logo_path.exists():
-                # Fallback to just logo if combined failed
-                img = PILImage.open(logo_path)
-                logo_w_px = int(round(logo_width_mm * scale))
-                logo_h_px = int(round(logo_width_mm * (img.height/img.width) * scale))
-                if logo_w_px > 0 and logo_h_px > 0:
-                    img = img.resize((logo_w_px, logo_h_px), PILImage.LANCZOS)
+                # Fallback to just logo if combined failed (resized once per path/size)
+                def build_logo():
+                    img = PILImage.open(logo_path)
+                    logo_w_px = int(round(logo_width_mm * scale))
+                    logo_h_px = int(round(logo_width_mm * (img.height/img.width) * scale))
+                    if logo_w_px <= 0 or logo_h_px <= 0:
+                        return None
+                    return ImageTk.PhotoImage(img.resize((logo_w_px, logo_h_px), PILImage.LANCZOS))
+                logo_photo = self._cached_image(
+                    ('logo_photo', str(logo_path), logo_path.stat().st_mtime, logo_width_mm, scale), build_logo)
+                if logo_photo:
                     # center logo in block
                     lx = x1 + (actual_block_w_mm - logo_width_mm) / 2 * scale
                     if canvas == self.embedded_canvas:
-                        self._embedded_sig_photo = ImageTk.PhotoImage(img)
+                        self._embedded_sig_photo = logo_photo
                         canvas.create_image(lx, y1, anchor=NW, image=self._embedded_sig_photo, tags="logo")
                     else:
-                        self._preview_sig_photo = ImageTk.PhotoImage(img)
+                        self._preview_sig_photo = logo_photo
                         canvas.create_image(lx, y1, anchor=NW, image=self._preview_sig_photo, tags="logo")
                     drawn_image = True
         except Exception as e:
@@ -2562,29 +3362,23 @@ Devam etmek istiyor musunuz?"""
             except Exception:
                 pass
 
-        # Always draw the rectangle for drag purposes
-        canvas.create_rectangle(logo_x1, y1, logo_x2, y1 + total_sig_height_px, outline="", tags="logo")
-        # For very small rectangles, add an invisible larger hit-area to ease mouse targeting (tagged separately)
-        try:
-            min_hit_h = 8  # pixels - only for interaction convenience
-            if total_sig_height_px < min_hit_h:
-                pad = (min_hit_h - total_sig_height_px)
-                hit_top = y1 - (pad/2)
-                hit_bottom = y1 + total_sig_height_px + (pad/2)
-                hit_rect = canvas.create_rectangle(logo_x1 - 2, hit_top, logo_x2 + 2, hit_bottom, outline="", tags=("logo_hit",))
-                # Ensure the hit rect is below visible items so it doesn't obscure visuals
-                try:
-                    canvas.tag_lower(hit_rect)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # One rectangle per canvas is the drag target; it outlives signature
+        # rebuilds and is only re-positioned (filled when there is no image)
+        hit_box = (logo_x1, y1 - hit_pad, logo_x2, y1 + total_sig_height_px + hit_pad)
+        fill, stipple = ("", "") if drawn_image else (SIG_BOX_COLOR, "gray50")
+        if anchor_rect is not None and canvas.coords(anchor_rect):
+            canvas.coords(anchor_rect, *hit_box)
+            canvas.itemconfig(anchor_rect, fill=fill, stipple=stipple)
+            canvas.tag_raise(anchor_rect)
+        else:
+            anchor_rect = canvas.create_rectangle(*hit_box, outline="", fill=fill, stipple=stipple, tags="logo_hit")
 
         if not drawn_image:
-            # Fill rectangle if no image
-            canvas.itemconfig(canvas.find_withtag("logo")[-1], fill=SIG_BOX_COLOR, stipple="gray50")
             text_cy = y1 + (total_sig_height_px / 2)
             canvas.create_text((logo_x1 + logo_x2) / 2, text_cy, text="İmza", fill="white", font=("Segoe UI", int(10 * (scale/2.5)), "bold"), tags="logo")
+
+        if layer_key is not None:
+            self._canvas_layers[canvas] = (layer_key, anchor_rect, bg_layer_key)
             
         # No longer drawing info_text separately since it's in the combined image
         # (Removed separate canvas.create_text call for info_text)
@@ -2592,33 +3386,142 @@ Devam etmek istiyor musunuz?"""
     def _auto_refresh_preview(self, *args):
         """Debounced auto-refresh for the preview window.
 
-        Schedules a single redraw 250ms after the last change. This avoids
-        reacting to transient empty values while the user is editing.
+        Schedules a single redraw PREVIEW_REFRESH_DEBOUNCE ms after the last
+        change. This avoids reacting to transient empty values while the user
+        is editing.
         """
+        self._debounce('preview', PREVIEW_REFRESH_DEBOUNCE_NS, self._run_preview_refresh)
+
+    def _run_preview_refresh(self):
+        # If the entry is currently empty (user clicked to replace), postpone until it has some content
         try:
-            # Cancel previously scheduled refresh
-            try:
-                if getattr(self, '_preview_refresh_after_id', None):
-                    self.root.after_cancel(self._preview_refresh_after_id)
-            except Exception:
-                pass
-            # If the entry is currently empty (user clicked to replace), postpone scheduling until it has some content
+            if self.sig_width_var.get() == "":
+                self._auto_refresh_preview()
+                return
+        except Exception:
+            pass
+        self._show_signature_preview(silent=True)
+
+    def _debounce(self, key, interval_ns, callback):
+        """Run callback once, interval_ns after the last call for this key.
+
+        Repeated calls only move the deadline forward (a monotonic_ns
+        subtraction); a single Tk timer per key is kept and re-armed for the
+        remaining time when it fires early, instead of an after_cancel/after
+        round-trip on every keystroke.
+        """
+        try:
+            deadline = time.monotonic_ns() + interval_ns
+            state = self._debounce_state.get(key)
+            if state is not None:
+                state[0] = deadline
+                state[1] = callback
+                return
+            after_id = self.root.after(interval_ns // 1_000_000, lambda: self._fire_debounced(key))
+            self._debounce_state[key] = [deadline, callback, after_id]
+        except Exception:
+            pass
+
+    def _fire_debounced(self, key):
+        state = self._debounce_state.get(key)
+        if state is None:
+            return
+        remaining = state[0] - time.monotonic_ns()
+        if remaining > 0:
+            state[2] = self.root.after(max(1, remaining // 1_000_000), lambda: self._fire_debounced(key))
+            return
+        del self._debounce_state[key]
+        try:
+            state[1]()
+        except Exception:
+            pass
+
+    def _on_sig_font_write(self, *args):
+        """Trace callback for the font family/style variables."""
+        self._mark_sig_dirty(_SIG_DIRTY_FONT)
+
+    def _on_sig_geom_write(self, *args):
+        """Trace callback for the size variables."""
+        self._mark_sig_dirty(_SIG_DIRTY_GEOM)
+
+    def _on_sig_margin_write(self, *args):
+        """Trace callback for the margin variables."""
+        self._mark_sig_dirty(_SIG_DIRTY_MARGIN)
+
+    def _on_sig_placement_write(self, *args):
+        """Trace callback for the placement variable."""
+        self._mark_sig_dirty(_SIG_DIRTY_PLACEMENT)
+
+    def _suspend_margin_traces(self):
+        """Detach the margin traces; a drag updates the canvas items directly."""
+        traces = getattr(self, '_margin_traces', None)
+        if not traces:
+            return
+        for var, trace_id in list(traces.items()):
             try:
-                v = self.sig_width_var.get()
-                if v == "":
-                    # schedule a re-check later; skip immediate refresh
-                    self._preview_refresh_after_id = self.root.after(250, lambda: self._auto_refresh_preview())
-                    return
+                var.trace_remove('write', trace_id)
+                traces[var] = None
             except Exception:
                 pass
-            # Schedule a new refresh after 250ms
-            self._preview_refresh_after_id = self.root.after(250, lambda: self._show_signature_preview(silent=True))
-        except Exception:
-            pass
+
+    def _resume_margin_traces(self):
+        """Re-attach margin traces detached by _suspend_margin_traces."""
+        traces = getattr(self, '_margin_traces', None)
+        if not traces:
+            return
+        for var, trace_id in list(traces.items()):
+            if trace_id is None:
+                try:
+                    traces[var] = var.trace_add('write', self._on_sig_margin_write)
+                except Exception:
+                    pass
+
+    def _mark_sig_dirty(self, flag):
+        """Record a signature control change and schedule one flush per frame."""
+        self._sig_dirty |= flag
+        if not self._sig_refresh_pending:
+            self._sig_refresh_pending = True
+            self.root.after(_SIG_REFRESH_DELAY_MS, self._flush_sig_refresh)
+
+    def _flush_sig_refresh(self):
+        """Apply all signature control changes recorded since the last flush."""
+        dirty, self._sig_dirty = self._sig_dirty, 0
+        self._sig_refresh_pending = False
+        try:
+            if dirty & _SIG_DIRTY_FONT:
+                self._refresh_sig_info_font()
+            # During a drag the canvas items are moved directly; the release handler redraws once
+            if not self._is_dragging:
+                if dirty & _SIG_DIRTY_PLACEMENT:
+                    self._on_placement_change()
+                elif dirty == _SIG_DIRTY_MARGIN:
+                    self._reposition_signature_only()
+                elif dirty:
+                    self._update_preview()
+        finally:
+            if dirty:
+                self._schedule_save_signature_settings()
 
     def _update_preview(self):
-        """Simple wrapper for silent preview refresh."""
-        self._show_signature_preview(silent=True)
+        """Simple wrapper for silent preview refresh (debounced)."""
+        self._auto_refresh_preview()
+
+    def _reposition_signature_only(self):
+        """Apply a margin-only change right away, without the debounced refresh.
+
+        The signature image, text and background are unchanged, so drawing
+        hits the move-only path of _draw_preview_on_canvas (canvas.move on
+        the existing items); it falls back to a full draw by itself if the
+        canvas has no matching layer.
+        """
+        try:
+            self._draw_preview_on_canvas(self.embedded_canvas, scale=1.35, silent=True)
+            preview = getattr(self, '_preview_canvas', None)
+            if preview is not None and self._preview_win.winfo_exists():
+                self._draw_preview_on_canvas(preview, scale=_PREVIEW_WIN_SCALE, silent=True)
+            self._preview_drawn_key = self._preview_input_key()
+        except Exception:
+            self._auto_refresh_preview()
 
     def _on_width_spin(self):
         self._auto_refresh_preview()
@@ -2700,16 +3603,30 @@ Devam etmek istiyor musunuz?"""
                 # Store original margins to calculate delta
                 self._drag_orig_margin_x = float(self.sig_margin_x_var.get() or 0)
                 self._drag_orig_margin_y = float(self.sig_margin_y_var.get() or 0)
+                self._suspend_margin_traces()
                 event.widget.config(cursor="fleur")
                 # Hide tooltips when dragging starts
                 self._hide_canvas_tooltip()
         except Exception:
             pass
 
+    # Minimum interval between processed drag events (~60 fps)
+    _DRAG_INTERVAL_NS = 16_000_000
+
     def _on_canvas_drag(self, event):
         """Update signature margins during drag without full redraw for better performance."""
-        if not getattr(self, '_is_dragging', False):
+        if not self._is_dragging:
+            return
+        # Drop motion events arriving faster than the frame interval; the
+        # next processed event (or the release) catches up on the delta
+        now = time.monotonic_ns()
+        if now - self._drag_last_ns < self._DRAG_INTERVAL_NS:
             return
+        self._drag_last_ns = now
+        self._apply_canvas_drag(event)
+
+    def _apply_canvas_drag(self, event):
+        """Move the signature items and update margins for the drag position."""
         try:
             # Move items on canvas immediately for smooth feedback
             dx_total = event.x - self._drag_start_x
@@ -2718,7 +3635,9 @@ Devam etmek istiyor musunuz?"""
             move_x = event.x - self._drag_last_x
             move_y = event.y - self._drag_last_y
             
+            # Only the signature overlay moves; the page raster stays untouched
             event.widget.move("logo", move_x, move_y)
+            event.widget.move("logo_hit", move_x, move_y)
             self._drag_last_x = event.x
             self._drag_last_y = event.y
 
@@ -2763,8 +3682,12 @@ Devam etmek istiyor musunuz?"""
 
     def _on_canvas_release(self, event):
         """End drag operation and save settings."""
-        if getattr(self, '_is_dragging', False):
+        if self._is_dragging:
+            # Apply the final position in case the last motion was throttled
+            self._apply_canvas_drag(event)
+            self._drag_last_ns = 0
             self._is_dragging = False
+            self._resume_margin_traces()
             event.widget.config(cursor="")
             # Full sync and refresh to ensure everything is perfect
             self._show_signature_preview(silent=True)
@@ -2772,16 +3695,7 @@ Devam etmek istiyor musunuz?"""
 
     def _schedule_save_signature_settings(self):
         """Debounced schedule to persist signature settings to config."""
-        try:
-            try:
-                if getattr(self, '_save_sig_after_id', None):
-                    self.root.after_cancel(self._save_sig_after_id)
-            except Exception:
-                pass
-            # schedule actual save after 350ms
-            self._save_sig_after_id = self.root.after(350, self._auto_save_signature_settings)
-        except Exception:
-            pass
+        self._debounce('save_signature', SIGNATURE_SAVE_DEBOUNCE_NS, self._auto_save_signature_settings)
 
     def _auto_save_signature_settings(self):
         """Persist validated signature settings to config automatically."""
@@ -2800,32 +3714,48 @@ Devam etmek istiyor musunuz?"""
             placement_code = self._placement_map.get(placement_display)
             if not placement_code:
                 # fallback to default
-                placement_code = DEFAULT_SIGNATURE_SETTINGS.get('placement')
+                placement_code = DEFAULT_SIGNATURE_SETTINGS.placement
 
             # write config
             try:
                 if getattr(self, 'config', None) is None:
                     self.config = {}
-                self.config.setdefault('signature', {})['width_mm'] = w
-                self.config['signature']['logo_width_mm'] = lw
-                self.config['signature']['margin_x_mm'] = mx
-                self.config['signature']['margin_y_mm'] = my
-                self.config['signature']['placement'] = placement_code
-                self.config['signature']['font_family'] = self.sig_font_var.get()
-                self.config['signature']['font_style'] = self.sig_style_var.get()
+                values = {
+                    'width_mm': w,
+                    'logo_width_mm': lw,
+                    'margin_x_mm': mx,
+                    'margin_y_mm': my,
+                    'placement': placement_code,
+                    'font_family': self.sig_font_var.get(),
+                    'font_style': self.sig_style_var.get(),
+                }
+                sig = self.config.setdefault('signature', {})
+                # Nothing changed since the last write: skip the disk I/O
+                if all(sig.get(k) == v for k, v in values.items()):
+                    return
+                sig.update(values)
                 save_config(self.config)
             except Exception as e:
                 self.log_message(f'⚠️ İmza ayarları kaydedilemedi: {e}')
         except Exception:
             pass
 
+    def _on_signing_option_write(self, *args):
+        """Trace callback for the LTV/TSA variables."""
+        self._schedule_save_signing_settings()
+
+    def _schedule_save_signing_settings(self):
+        """Debounced schedule to persist signing options to config."""
+        self._debounce('save_signing', SIGNATURE_SAVE_DEBOUNCE_NS, self._save_signing_settings)
+
     def _save_signing_settings(self):
-        """Persist signing options (LTV, TSA enabled, DocMDP) to config."""
+        """Persist signing options (LTV, TSA enabled, PDF preview, DocMDP) to config."""
         try:
             if getattr(self, 'config', None) is None:
                 self.config = {}
             self.config.setdefault('signing', {})['ltv_enabled'] = bool(self.ltv_var.get())
             self.config['signing']['tsa_enabled'] = bool(self.tsa_enabled_var.get())
+            self.config['signing']['pdf_preview'] = bool(self.pdf_preview_var.get())
             try:
                 display = self.docmdp_var.get()
                 mode = self._docmdp_map.get(display, 'signing_only')
@@ -3330,29 +4260,23 @@ Devam etmek istiyor musunuz?"""
         Keeps font size fixed to avoid layout changes; only family and weight change.
         """
         try:
-            fam_map = {
-                'Segoe': 'Segoe UI',
-                'Arial': 'Arial',
-                'Times': 'Times New Roman',
-                'Verdana': 'Verdana',
-                'Tahoma': 'Tahoma',
-                'Courier': 'Courier New'
-            }
             fam = self.sig_font_var.get() if getattr(self, 'sig_font_var', None) else 'Segoe'
-            fam_display = fam_map.get(str(fam).split()[0], 'Segoe UI')
+            fam_display = _SIG_INFO_FONT_FAMILIES.get(str(fam).split()[0], 'Segoe UI')
             style = self.sig_style_var.get() if getattr(self, 'sig_style_var', None) else 'Normal'
             weight = 'bold' if str(style).lower().startswith('bold') else 'normal'
             # Keep size constant (8pt in preview)
+            key = (fam_display, 8, weight)
+            if key == getattr(self, '_sig_info_font_key', None):
+                return
             try:
-                self.sig_info_text_label.configure(font=(fam_display, 8, weight))
+                self.sig_info_text_label.configure(font=key)
             except Exception:
                 # fallback to setting options individually
                 try:
-                    import tkinter as tk
-                    f = tk.font.Font(family=fam_display, size=8, weight=weight)
-                    self.sig_info_text_label.configure(font=f)
+                    self.sig_info_text_label.configure(font=_make_font(*key))
                 except Exception:
-                    pass
+                    return
+            self._sig_info_font_key = key
         except Exception:
             pass
 
@@ -3418,8 +4342,7 @@ Devam etmek istiyor musunuz?"""
     def _update_signature_image_display(self):
         """Load and display the current signature image and info text in the template panel."""
         try:
-            from PIL import Image, ImageTk
-            from sign_pdf import resource_path
+            Image, ImageTk = _get_pil()
             
             # Check config for custom path, fallback to default logo_imza.png
             sig_conf = self.config.get('signature', {})
@@ -3427,15 +4350,24 @@ Devam etmek istiyor musunuz?"""
             
             img_path = Path(img_path_str) if img_path_str else resource_path('logo_imza.png')
             
-            if img_path.exists():
+            try:
+                thumb_key = (str(img_path), img_path.stat().st_mtime)
+            except OSError:
+                thumb_key = None
+            if thumb_key is None:
+                self._sig_thumb_key = None
+                self.sig_img_label.configure(image='', text="Görsel bulunamadı\n(logo_imza.png)")
+            elif thumb_key != self._sig_thumb_key:
+                # Only decode and thumbnail when the image actually changed;
+                # every preview refresh passes through here
                 img = Image.open(img_path)
                 # Sağ sütun genişlediği için maksimum genişliği 330px'e çıkarıyoruz
                 img.thumbnail((330, 100), Image.LANCZOS)
                 self._sig_photo = ImageTk.PhotoImage(img)
                 self.sig_img_label.configure(image=self._sig_photo, text="")
-            else:
-                self.sig_img_label.configure(image='', text="Görsel bulunamadı\n(logo_imza.png)")
+                self._sig_thumb_key = thumb_key
         except Exception as e:
+            self._sig_thumb_key = None
             self.sig_img_label.configure(text=f"Görsel hatası: {e}")
             
         # İmza bilgi metnini güncelle (PDF'deki gerçek görünümü taklit eder)
@@ -3483,6 +4415,7 @@ Devam etmek istiyor musunuz?"""
                 self.config['signature'] = {}
             self.config['signature']['image_path'] = path
             save_config(self.config)
+            _resolve_logo_path.cache_clear()
             self.log_message(f"🖼️ Yeni imza görseli seçildi: {Path(path).name}")
             self._update_signature_image_display()
             # Also refresh preview if open
@@ -3565,5 +4498,8 @@ Devam etmek istiyor musunuz?"""
 
 
 if __name__ == "__main__":
+    # Frozen builds: let batch-signing worker processes start (spawn)
+    import multiprocessing
+    multiprocessing.freeze_support()
     app = ModernTTKApp()
     app.run()
\ No newline at end of file
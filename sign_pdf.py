@@ -6,6 +6,7 @@ import os
 import sys
 import threading
 import time
+from contextlib import nullcontext
 from pathlib import Path
 
 # Suppress verbose logging from libraries
@@ -25,6 +26,11 @@ import math
 from pathlib import Path
 from typing import Optional, List, Union
 
+from constants import (
+    CONFIG_DIR, CONFIG_FILE, DEFAULT_SIGNATURE_SETTINGS, LARGE_FILE_THRESHOLD, MM_TO_POINTS,
+    PLACEMENT_CODE_IDX, dumps_fast, loads_fast, mm_to_pt,
+)
+
 # Pikepdf and image tools for compression/rotation
 try:
     import pikepdf
@@ -109,6 +115,26 @@ try:
     from pyhanko.sign.fields import SigFieldSpec
     from pyhanko.pdf_utils.layout import SimpleBoxLayoutRule, Margins, AxisAlignment
     from pyhanko.pdf_utils.images import PdfImage
+
+    class _LockedPKCS11Signer(PKCS11Signer):
+        """PKCS11Signer that holds a shared lock around its token calls.
+
+        Used when several threads sign over one session (see sign_many): the
+        lazy key/certificate lookup and the signature itself both run under
+        the lock (an RLock, as the signature triggers the lookup).
+        """
+
+        def __init__(self, lock, **kwargs):
+            self._token_lock = lock
+            super().__init__(**kwargs)
+
+        def _load_objects(self):
+            with self._token_lock:
+                return super()._load_objects()
+
+        async def async_sign_raw(self, data, digest_algorithm, dry_run=False):
+            with self._token_lock:
+                return await super().async_sign_raw(data, digest_algorithm, dry_run=dry_run)
 except ImportError:
     pass
 
@@ -157,19 +183,6 @@ def check_if_signed(pdf_path):
         return False
 
 
-CONFIG_DIR = Path(os.environ.get('USERPROFILE', Path.home())) / '.imzaci'
-CONFIG_FILE = CONFIG_DIR / 'config.json'
-DEFAULT_DLL = Path(r"C:\Windows\System32\akisp11.dll")
-
-# Default signature/overlay settings (persisted under 'signature' in config)
-DEFAULT_SIGNATURE_SETTINGS = {
-    'width_mm': 4.5,     # font size in mm (formerly block width)
-    'logo_width_mm': 20.0, # width of the logo image itself (mm)
-    'margin_mm': 12.0,   # legacy single margin value (mm)
-    'margin_x_mm': 12.0, # horizontal margin (mm)
-    'margin_y_mm': 25.0, # vertical margin (mm)
-    'placement': 'top-right',
-}
 
 # Placement options: internal code -> localized label (Turkish)
 PLACEMENT_OPTIONS = [
@@ -485,6 +498,24 @@ def create_combined_signature_image(logo_imza_path, signer_lines, font_size_mm,
         _log(f"Error in create_combined_signature_image: {e}")
         return None, 0
 
+def placement_origin(view_w, view_h, block_w, block_h, mx, my, placement):
+    """Return the visual top-left (x, y) of a block for a placement code.
+
+    Units are whatever the caller uses (pt or mm); the origin is the top-left
+    corner of the page as the user sees it. Unknown codes fall back to top-right.
+    """
+    idx = PLACEMENT_CODE_IDX.get(placement, 0)
+    if idx == 0:    # top-right
+        return view_w - mx - block_w, my
+    if idx == 1:    # top-left
+        return mx, my
+    if idx == 2:    # bottom-right
+        return view_w - mx - block_w, view_h - my - block_h
+    if idx == 3:    # bottom-left
+        return mx, view_h - my - block_h
+    # center
+    return (view_w - block_w) / 2.0 + mx, (view_h - block_h) / 2.0 + my
+
 def apply_logo_xobject(in_path, overlay_path, out_path, add_to_all_pages=True, size_scale=0.8, placement='top-right', margin_x=None, margin_y=None, margin=None, target_width_mm=None, skip_first_page=False):
     """Apply the overlay image as a single XObject and reference it on target pages.
     Returns True on success, False on failure.
@@ -592,7 +623,7 @@ def apply_logo_xobject(in_path, overlay_path, out_path, add_to_all_pages=True, s
                     if target_width_mm is not None:
                         try:
                             # convert mm -> points (1in = 25.4mm, 1pt = 1/72in)
-                            desired_w = (float(target_width_mm) / 25.4) * 72.0
+                            desired_w = mm_to_pt(target_width_mm)
                         except Exception:
                             desired_w = min(img_w, page_width * 0.2) * size_scale
                     else:
@@ -624,24 +655,7 @@ def apply_logo_xobject(in_path, overlay_path, out_path, add_to_all_pages=True, s
                     view_h = page_height
 
                 # Calculate VISUAL coordinates based on user margins (relative to top-left 0,0 of the VIEW)
-                if placement == 'top-right':
-                    vis_x = view_w - mx - width_pt
-                    vis_y = my
-                elif placement == 'top-left':
-                    vis_x = mx
-                    vis_y = my
-                elif placement == 'bottom-right':
-                    vis_x = view_w - mx - width_pt
-                    vis_y = view_h - my - height_pt
-                elif placement == 'bottom-left':
-                    vis_x = mx
-                    vis_y = view_h - my - height_pt
-                elif placement == 'center':
-                    vis_x = (view_w - width_pt) / 2.0 + mx
-                    vis_y = (view_h - height_pt) / 2.0 + my
-                else:
-                    vis_x = view_w - mx - width_pt
-                    vis_y = my
+                vis_x, vis_y = placement_origin(view_w, view_h, width_pt, height_pt, mx, my, placement)
 
                 # Map Visual Coordinates to Physical PDF Coordinates and Rotation
                 cx = vis_x + width_pt / 2.0
@@ -767,7 +781,7 @@ def apply_logo_xobject(in_path, overlay_path, out_path, add_to_all_pages=True, s
             # Save with care: avoid aggressive recompress for big files
             try:
                 size_in = in_path.stat().st_size
-                if size_in > 10 * 1024 * 1024:
+                if size_in > LARGE_FILE_THRESHOLD:
                     pdf.save(out_path)
                 else:
                     pdf.remove_unreferenced_resources()
@@ -783,15 +797,35 @@ def apply_logo_xobject(in_path, overlay_path, out_path, add_to_all_pages=True, s
 def load_config():
     if CONFIG_FILE.exists():
         try:
-            return json.loads(CONFIG_FILE.read_text(encoding='utf-8'))
+            data = loads_fast(CONFIG_FILE.read_bytes())
         except json.JSONDecodeError:
             return {}
+        _migrate_legacy_margin(data)
+        return data
     return {}
 
 
+def _migrate_legacy_margin(data):
+    """One-shot migration of the legacy single 'margin_mm' signature key.
+
+    The value seeds margin_x_mm/margin_y_mm when those are missing, then the
+    key is dropped and the config is re-saved in the new shape.
+    """
+    sig = data.get('signature') if isinstance(data, dict) else None
+    if not isinstance(sig, dict) or 'margin_mm' not in sig:
+        return
+    legacy = sig.pop('margin_mm')
+    sig.setdefault('margin_x_mm', legacy)
+    sig.setdefault('margin_y_mm', legacy)
+    try:
+        save_config(data)
+    except Exception:
+        pass
+
+
 def save_config(data):
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(data, indent=2), encoding='utf-8')
+    CONFIG_FILE.write_bytes(dumps_fast(data))
 
 
 def ensure_config():
@@ -804,7 +838,28 @@ def format_error(exc):
 
 
 
+# Loaded PKCS#11 modules: resolved path -> ((mtime, size), lib). A module is
+# initialized once per process; the stamp forces a reload if the file changes.
+_PKCS11_LIBS = {}
+_PKCS11_LIBS_LOCK = threading.Lock()
+
+
+def cached_pkcs11_lib(path):
+    """Return the already loaded module for `path`, or None (never loads)."""
+    try:
+        p = Path(path).resolve()
+        st = p.stat()
+    except Exception:
+        return None
+    with _PKCS11_LIBS_LOCK:
+        entry = _PKCS11_LIBS.get(str(p))
+    if entry and entry[0] == (st.st_mtime, st.st_size):
+        return entry[1]
+    return None
+
+
 def load_pkcs11_lib(path):
+    """Load (or reuse) the PKCS#11 module at `path`."""
     lib_path = Path(path)
     if not lib_path.exists():
         # Try to resolve the path in case it's a symlink or on a mounted drive
@@ -819,11 +874,19 @@ def load_pkcs11_lib(path):
     
     # Verify it's actually accessible (not just existing but on disconnected drive)
     try:
-        _ = lib_path.stat()
+        st = lib_path.stat()
     except OSError as e:
         raise FileNotFoundError(f'PKCS#11 module not accessible at {lib_path}: {e}')
-    
-    return pkcs11.lib(str(lib_path))
+
+    key = str(lib_path.resolve())
+    stamp = (st.st_mtime, st.st_size)
+    with _PKCS11_LIBS_LOCK:
+        entry = _PKCS11_LIBS.get(key)
+        if entry and entry[0] == stamp:
+            return entry[1]
+        lib = pkcs11.lib(str(lib_path))
+        _PKCS11_LIBS[key] = (stamp, lib)
+        return lib
 
 
 def is_pkcs11_provider(path):
@@ -1100,6 +1163,43 @@ def list_certs(lib, slot=None, token_label=None, pin=None):
                 yield slot, token, label, subject, issuer, cert_obj.serial_number
 
 
+def _read_token_certs(session):
+    """Return (label, DER) for every certificate object on the token."""
+    certs = []
+    for cert in session.get_objects({Attribute.CLASS: ObjectClass.CERTIFICATE}):
+        try:
+            label = cert[Attribute.LABEL]
+        except Exception:
+            label = None
+        try:
+            der = cert[Attribute.VALUE]
+        except Exception:
+            der = None
+        certs.append((label, der))
+    return certs
+
+
+def read_signing_cert(session, cert_label=None, key_label=None):
+    """Resolve the signing labels and read the token certificates once.
+
+    Applies sign_cmd's defaults (key label falls back to the cert label,
+    then to the first labelled certificate). Returns a dict with key_label,
+    cert_label and certs, the (label, DER) pairs; sign_many passes it to
+    sign_cmd as cert_info so batch files don't search the token again.
+    """
+    try:
+        certs = _read_token_certs(session)
+    except Exception:
+        certs = []
+    key_label = key_label or cert_label
+    if not key_label:
+        auto_label = next((label for label, _ in certs if label), None)
+        if auto_label:
+            key_label = auto_label
+            cert_label = cert_label or auto_label
+    return {'key_label': key_label, 'cert_label': cert_label, 'certs': certs}
+
+
 def list_slots_cmd(args):
     lib = load_pkcs11_lib(args.pkcs11_lib)
     for slot in list_slots(lib):
@@ -1125,7 +1225,152 @@ def derive_slot(lib):
     return slots[0]
 
 
-def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=None):
+# Per-process state for process-pool batch signing (see sign_many)
+_WORKER_SESSION = None
+_WORKER_INIT_ERROR = None
+_WORKER_CERT_INFOS = {}
+
+
+def _init_sign_worker(pkcs11_lib, pin):
+    """Pool initializer: load the module and log in once per worker process.
+
+    Errors are kept and reported per file; raising here would make the
+    pool respawn the worker (and retry the login) endlessly.
+    """
+    global _WORKER_SESSION, _WORKER_INIT_ERROR
+    try:
+        lib = load_pkcs11_lib(pkcs11_lib)
+        token = derive_slot(lib).get_token()
+        _WORKER_SESSION = open_session(token, pin=pin)
+        # Log out and close the session when the worker exits normally
+        from multiprocessing import util
+        util.Finalize(None, _close_worker_session, exitpriority=10)
+    except Exception as exc:
+        _WORKER_INIT_ERROR = format_error(exc)
+
+
+def _close_worker_session():
+    global _WORKER_SESSION
+    session, _WORKER_SESSION = _WORKER_SESSION, None
+    if session is not None:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+def _sign_one_top_level(args, add_logo_all_pages=True):
+    """Sign one file in a pool process; returns (args, error message or None)."""
+    if _WORKER_INIT_ERROR is not None:
+        return args, _WORKER_INIT_ERROR
+    try:
+        # One certificate lookup per worker process and label pair
+        labels = (args.cert_label, args.key_label)
+        if labels not in _WORKER_CERT_INFOS:
+            _WORKER_CERT_INFOS[labels] = read_signing_cert(_WORKER_SESSION, *labels)
+        sign_cmd(args, add_logo_all_pages=add_logo_all_pages, session=_WORKER_SESSION,
+                 work_dir=TEMP_DIR / f"batch_p{os.getpid()}", cert_info=_WORKER_CERT_INFOS[labels])
+    except Exception as exc:
+        return args, format_error(exc)
+    return args, None
+
+
+def _sign_many_processes(pkcs11_lib, pin, args_iter, add_logo_all_pages, max_workers):
+    import multiprocessing
+    from functools import partial
+    # spawn: a forked child must not inherit the parent's initialized PKCS#11 module
+    ctx = multiprocessing.get_context('spawn')
+    pool = ctx.Pool(max_workers, initializer=_init_sign_worker, initargs=(pkcs11_lib, pin))
+    try:
+        job = partial(_sign_one_top_level, add_logo_all_pages=add_logo_all_pages)
+        for args, err in pool.imap_unordered(job, args_iter):
+            yield args, (RuntimeError(err) if err is not None else None)
+    finally:
+        # close/join rather than terminate (what the pool's with-block does):
+        # workers then exit normally and run _close_worker_session, so no
+        # token is left logged in by a killed process
+        pool.close()
+        pool.join()
+
+
+def sign_many(pkcs11_lib, pin, args_iter, add_logo_all_pages=True, gui_logger=None, max_workers=1,
+              use_processes=False):
+    """Sign several PDFs over a single PKCS#11 session (one login).
+
+    args_iter yields sign_cmd-style args. Yields (args, error) after each
+    file; error is None on success. A failed login raises before any file
+    is signed.
+
+    The signing key/cert labels and the token certificates are read once
+    per batch (read_signing_cert) before any file is signed.
+
+    With max_workers > 1 files are signed on a thread pool and results come
+    in completion order: PDF processing and TSA requests overlap, while the
+    remaining token calls (key lookup, signature) are serialized on the
+    shared session. Each worker thread gets its own temp directory.
+
+    use_processes runs the files on a process pool instead (bypassing the
+    GIL); each worker process logs in on its own, so this is only for
+    tokens/middleware that allow several concurrent sessions. gui_logger
+    is not forwarded to the worker processes.
+    """
+    if use_processes and max_workers > 1:
+        yield from _sign_many_processes(pkcs11_lib, pin, args_iter, add_logo_all_pages, max_workers)
+        return
+
+    args_list = list(args_iter)
+    lib = load_pkcs11_lib(pkcs11_lib)
+    token = derive_slot(lib).get_token()
+    with open_session(token, pin=pin) as session:
+        cert_infos = {}
+        for args in args_list:
+            labels = (args.cert_label, args.key_label)
+            if labels not in cert_infos:
+                cert_infos[labels] = read_signing_cert(session, *labels)
+
+        if max_workers <= 1:
+            for args in args_list:
+                try:
+                    sign_cmd(args, add_logo_all_pages=add_logo_all_pages, gui_logger=gui_logger, session=session,
+                             cert_info=cert_infos[(args.cert_label, args.key_label)])
+                except Exception as exc:
+                    yield args, exc
+                else:
+                    yield args, None
+            return
+
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        # Reentrant: the signer's signature call triggers its key lookup
+        sign_lock = threading.RLock()
+
+        def sign_one(args):
+            work_dir = TEMP_DIR / f"batch_{threading.get_ident()}"
+            sign_cmd(args, add_logo_all_pages=add_logo_all_pages, gui_logger=gui_logger,
+                     session=session, sign_lock=sign_lock, work_dir=work_dir,
+                     cert_info=cert_infos[(args.cert_label, args.key_label)])
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(sign_one, args): args for args in args_list}
+            for fut in as_completed(futures):
+                yield futures[fut], fut.exception()
+
+
+def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=None, session=None,
+             sign_lock=None, work_dir=None, cert_info=None):
+    """Sign args.in_path into args.out_path.
+
+    When session is given (see sign_many) it is used as-is and stays open;
+    otherwise the token is opened and logged in with args.pin. sign_lock
+    serializes every token call when the session is shared between
+    threads; work_dir replaces TEMP_DIR for this call's temporary files.
+    cert_info (from read_signing_cert) supplies the labels and certificates
+    so the token isn't searched again.
+    """
+    if work_dir is None:
+        work_dir = TEMP_DIR
+    else:
+        work_dir = Path(work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
     # 3. Handle Compression (Before Signing) & Strict Incremental Mode
     # Ensure paths are Path objects
     if args.in_path and not isinstance(args.in_path, Path):
@@ -1195,7 +1440,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
         # Pre-check for compression
         if compress_pdf:
             try:
-                compressed_temp_file = TEMP_DIR / f"compressed_{args.in_path.name}"
+                compressed_temp_file = work_dir / f"compressed_{args.in_path.name}"
                 compressed_temp_file.parent.mkdir(parents=True, exist_ok=True)
                 
                 if compress_pdf_file(args.in_path, compressed_temp_file):
@@ -1208,26 +1453,28 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
 
     args.in_path = input_file_to_sign
 
-    lib = load_pkcs11_lib(args.pkcs11_lib)
-    slot = derive_slot(lib)
-    token = slot.get_token()
-
-    def first_cert_label(session):
-        for cert in session.get_objects({Attribute.CLASS: ObjectClass.CERTIFICATE}):
-            try:
-                return cert[Attribute.LABEL]
-            except Exception:
-                continue
-        return None
-
-    with token.open(user_pin=args.pin) as session:
-        cert_label = args.cert_label
-        key_label = args.key_label or cert_label
-        if not key_label:
-            auto_label = first_cert_label(session)
-            if auto_label:
-                key_label = auto_label
-                cert_label = cert_label or auto_label
+    if session is not None:
+        # Caller owns the session (and the login)
+        session_cm = nullcontext(session)
+    else:
+        lib = load_pkcs11_lib(args.pkcs11_lib)
+        slot = derive_slot(lib)
+        token = slot.get_token()
+        session_cm = token.open(user_pin=args.pin)
+
+    # Every token access below goes through this lock on a shared session
+    session_lock = sign_lock if sign_lock is not None else nullcontext()
+
+    with session_cm as session:
+        if cert_info is None:
+            with session_lock:
+                cert_info = read_signing_cert(session, args.cert_label, args.key_label)
+        cert_label = cert_info['cert_label']
+        key_label = cert_info['key_label']
+        # (label, DER) pairs of the token certificates
+        token_certs = cert_info['certs']
+        signing_der = next((der for label, der in token_certs
+                            if der and label and label == cert_label), None)
         if not key_label:
             raise RuntimeError('Private key label bulunamadı; GUI veya --list-keys ile seçmeyi deneyin')
 
@@ -1255,12 +1502,27 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
         import time
         signature_field_name = f"Signature_{int(time.time())}"
         
-        signer = PKCS11Signer(
+        if sign_lock is not None:
+            # Session shared between threads: one token signature at a time
+            from functools import partial
+            signer_cls = partial(_LockedPKCS11Signer, sign_lock)
+        else:
+            signer_cls = PKCS11Signer
+        signer_kwargs = {}
+        if signing_der:
+            # Already read from the token: saves pyHanko another search
+            try:
+                from asn1crypto import x509 as asn1_x509
+                signer_kwargs['signing_cert'] = asn1_x509.Certificate.load(signing_der)
+            except Exception:
+                pass
+        signer = signer_cls(
             pkcs11_session=session,
             key_label=key_label,
             cert_label=cert_label,
             use_raw_mechanism=True,
             prefer_pss=True,
+            **signer_kwargs
         )
         # Certification: set DocMDP permissions on first signature if configured
         cert_kwargs = {}
@@ -1329,14 +1591,17 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                      block_width_mm = 40.0
                 
                 logo_width_mm = float(sig_conf.get('logo_width_mm', DEFAULT_SIGNATURE_SETTINGS.get('logo_width_mm', 15.0)))
-                margin_x_val = float(sig_conf.get('margin_x_mm', DEFAULT_SIGNATURE_SETTINGS['margin_mm']))
-                margin_y_val = float(sig_conf.get('margin_y_mm', DEFAULT_SIGNATURE_SETTINGS['margin_mm']))
+                margin_x_val = float(sig_conf.get('margin_x_mm', DEFAULT_SIGNATURE_SETTINGS['margin_x_mm']))
+                margin_y_val = float(sig_conf.get('margin_y_mm', DEFAULT_SIGNATURE_SETTINGS['margin_y_mm']))
                 placement = sig_conf.get('placement', DEFAULT_SIGNATURE_SETTINGS['placement'])
                 
                 # 2. Create Combined Text+Logo Image (Reuse logic)
                 try:
+                    from cryptography import x509
+                    from cryptography.hazmat.backends import default_backend
                     from cryptography.x509.oid import NameOID
-                    subj_name = signer.signing_cert.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
+                    signing_cert_obj = x509.load_der_x509_certificate(signing_der, default_backend())
+                    subj_name = signing_cert_obj.subject.get_attributes_for_oid(NameOID.COMMON_NAME)[0].value
                 except Exception:
                     subj_name = "İmzacı"
                     
@@ -1352,14 +1617,9 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                 # Add serial number to signer lines for full content
                 try:
                     cert_serial_str = None
-                    for cert in session.get_objects({Attribute.CLASS: ObjectClass.CERTIFICATE}):
-                        try:
-                            lbl = cert[Attribute.LABEL]
-                        except Exception:
-                            lbl = None
+                    for lbl, cert_der in token_certs:
                         if lbl and cert_label and lbl == cert_label:
                             try:
-                                cert_der = cert[Attribute.VALUE]
                                 from cryptography import x509
                                 from cryptography.hazmat.backends import default_backend
                                 cert_obj = x509.load_der_x509_certificate(cert_der, default_backend())
@@ -1373,7 +1633,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                     pass
 
                 # Initialize placeholder for signature image that will be shown on Page 0 via pyHanko
-                stamp_img_path = TEMP_DIR / 'stamp_visual.png'
+                stamp_img_path = work_dir / 'stamp_visual.png'
                 
                 # Check for provided visual stamp from GUI (use as-is for Page 0 in both modes)
                 # In Multi-Sig mode: Page 0 shows gui_preview_sig.png (from GUI), Pages 1+ show logo_imza_with_text.png
@@ -1475,9 +1735,9 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                          pass
 
                     # Convert mm margins to points
-                    mx = (margin_x_val / 25.4) * 72.0
-                    my = (margin_y_val / 25.4) * 72.0
-                    vis_w = (final_block_w_mm / 25.4) * 72.0
+                    mx = mm_to_pt(margin_x_val)
+                    my = mm_to_pt(margin_y_val)
+                    vis_w = mm_to_pt(final_block_w_mm)
                     # height ratio from image
                     vis_h = (img_obj.height / img_obj.width) * vis_w
                     
@@ -1573,7 +1833,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
         # pyHanko is sensitive to Hybrid XRefs which pypdf might produce.
         # We try to repair the file structure here.
         def repair_pdf(in_path):
-            repaired_path = TEMP_DIR / f"repaired_{in_path.name}"
+            repaired_path = work_dir / f"repaired_{in_path.name}"
             # Method 1: pikepdf (Best)
             if pikepdf:
                 try:
@@ -1623,7 +1883,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                  
                  # Create overlay for background pages (logo_imza_with_text.png)
                  # This was previously done in the "unsigned" block, now doing it earlier
-                 temp_overlay_for_presign = TEMP_DIR / 'temp_overlay_presign.pdf'
+                 temp_overlay_for_presign = work_dir / 'temp_overlay_presign.pdf'
                  temp_overlay_for_presign.parent.mkdir(parents=True, exist_ok=True)
                  
                  # Reuse overlay creation logic (simplified, just logo for pages 1+)
@@ -1654,7 +1914,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                  
                  # Actually, re-use the combined image from the overlay block
                  # We need to create logo_imza_with_text.png
-                 combined_path = TEMP_DIR / f'logo_imza_with_text_presign.png'
+                 combined_path = work_dir / f'logo_imza_with_text_presign.png'
                  
                  # Quick check: do we have signer_lines?
                  # We extracted them earlier, let's use simplified (date only) for pages 1+
@@ -1708,13 +1968,13 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                              writer.add_page(page)
                          _log(f"✏️  Pages 1-{len(reader.pages)-1}: Added WITH overlay merged")
                          
-                         temp_merged_presign = TEMP_DIR / 'temp_merged_presign.pdf'
+                         temp_merged_presign = work_dir / 'temp_merged_presign.pdf'
                          writer.write(temp_merged_presign)
                  
                  # Sanitize with pikepdf
                  if pikepdf:
                      try:
-                         temp_sanitized = TEMP_DIR / 'temp_merged_presign_sanitized.pdf'
+                         temp_sanitized = work_dir / 'temp_merged_presign_sanitized.pdf'
                          with pikepdf.open(temp_merged_presign) as _pdf:
                              _pdf.save(temp_sanitized)
                          temp_merged_presign = temp_sanitized
@@ -1820,7 +2080,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
             from fpdf import FPDF
             
              # FPDF2 ile overlay PDF oluştur - cache'den kullan
-            temp_overlay = TEMP_DIR / 'temp_overlay.pdf'
+            temp_overlay = work_dir / 'temp_overlay.pdf'
             temp_overlay.parent.mkdir(parents=True, exist_ok=True)
             
             # ... (Rest of existing logic for unsigned files) ...
@@ -1861,7 +2121,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
             # Prepare and add signature image (logo_imza) first so XObject optimization picks it up
             logo_imza_for_pdf = None
             if logo_imza_path.exists():
-                # Signature settings: width_mm, margin_mm, placement (GUI-configurable or from config file)
+                # Signature settings: width_mm, margin_x_mm/margin_y_mm, placement (GUI-configurable or from config file)
                 try:
                     owner = getattr(gui_logger, '__self__', None)
                     sig_conf = owner.config.get('signature', {}) if owner else load_config().get('signature', {})
@@ -1918,15 +2178,14 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
 
                 _log(f"🔎 DEBUG block_width_mm: {block_width_mm}, logo_width_mm: {logo_width_mm}")
 
-                logo_margin_mm = float(sig_conf.get('margin_mm', DEFAULT_SIGNATURE_SETTINGS['margin_mm']))
                 placement = sig_conf.get('placement', DEFAULT_SIGNATURE_SETTINGS['placement'])
 
                 # Compute placement using separate X/Y margins (merge fallback uses mm).
                 # Vertical margin is interpreted as distance from the nearest vertical edge
                 try:
                     sig_conf_local = sig_conf or {}
-                    margin_x_val = float(sig_conf_local.get('margin_x_mm', DEFAULT_SIGNATURE_SETTINGS['margin_mm']))
-                    margin_y_val = float(sig_conf_local.get('margin_y_mm', DEFAULT_SIGNATURE_SETTINGS['margin_mm']))
+                    margin_x_val = float(sig_conf_local.get('margin_x_mm', DEFAULT_SIGNATURE_SETTINGS['margin_x_mm']))
+                    margin_y_val = float(sig_conf_local.get('margin_y_mm', DEFAULT_SIGNATURE_SETTINGS['margin_y_mm']))
                     # Use the margins directly for output placement.
                     margin_y_for_output = margin_y_val
 
@@ -2179,14 +2438,9 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                     cert_fp_short = None
                     cert_fp_full = None
                     try:
-                        for cert in session.get_objects({Attribute.CLASS: ObjectClass.CERTIFICATE}):
-                            try:
-                                lbl = cert[Attribute.LABEL]
-                            except Exception:
-                                lbl = None
+                        for lbl, cert_der in token_certs:
                             if lbl and cert_label and lbl == cert_label:
                                 try:
-                                    cert_der = cert[Attribute.VALUE]
                                     cert_obj = x509.load_der_x509_certificate(cert_der, default_backend())
                                     try:
                                         from cryptography.x509.oid import NameOID
@@ -2327,7 +2581,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                                  pass
                     
                     elif signer_lines:
-                        combined_path = TEMP_DIR / f'logo_imza_with_text.png'
+                        combined_path = work_dir / f'logo_imza_with_text.png'
                         # Respect configured font family/style when creating combined image
                         font_family_cfg = sig_conf.get('font_family') if sig_conf else None
                         font_style_cfg = sig_conf.get('font_style', 'Normal') if sig_conf else 'Normal'
@@ -2399,7 +2653,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                                 # Let's stick with rotate(-img_rot) as derived in thought process.
                                 # -(-90) = 90 (CCW) => correct for 90 CW page.
                                 rot_img = im.rotate(-img_rot, expand=True, resample=PILImage.BICUBIC)
-                                rotated_path = TEMP_DIR / f"rot_{rotate}_{logo_imza_for_pdf.name}"
+                                rotated_path = work_dir / f"rot_{rotate}_{logo_imza_for_pdf.name}"
                                 rot_img.save(rotated_path)
                                 final_img_path = rotated_path
                         except Exception as e:
@@ -2416,7 +2670,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
             pdf.output(str(temp_overlay))
             
             # Try XObject-based optimization first if requested
-            temp_with_logo = TEMP_DIR / 'temp_with_logo.pdf'
+            temp_with_logo = work_dir / 'temp_with_logo.pdf'
             temp_with_logo.parent.mkdir(parents=True, exist_ok=True)
             used_xobject = False
             # honor CLI flag if present, otherwise default to the `use_xobject_opt` parameter (now True by default)
@@ -2433,8 +2687,8 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                     try:
                         # Convert X/Y margins from mm -> pt for pikepdf placement
                         try:
-                            margin_x_pt = (margin_x_val / 25.4) * 72.0
-                            margin_y_pt = (margin_y_for_output / 25.4) * 72.0
+                            margin_x_pt = mm_to_pt(margin_x_val)
+                            margin_y_pt = mm_to_pt(margin_y_for_output)
                         except Exception:
                             margin_x_pt = margin_y_pt = 20.0
                     except Exception:
@@ -2524,14 +2778,14 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                                 for page_num in range(len(reader.pages)):
                                     writer.add_page(reader.pages[page_num])
                             
-                            temp_with_logo = TEMP_DIR / 'temp_with_logo.pdf'
+                            temp_with_logo = work_dir / 'temp_with_logo.pdf'
                             temp_with_logo.parent.mkdir(parents=True, exist_ok=True)
                             writer.write(temp_with_logo)
                             
                             # Sanitize with pikepdf if available to fix XRef structure (prevent Hybrid XRef errors)
                             if pikepdf:
                                 try:
-                                    temp_sanitized = TEMP_DIR / 'temp_sanitized.pdf'
+                                    temp_sanitized = work_dir / 'temp_sanitized.pdf'
                                     with pikepdf.open(temp_with_logo) as _pdf:
                                         _pdf.save(temp_sanitized)
                                     temp_with_logo = temp_sanitized
@@ -2623,7 +2877,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                         # Use the SAME calculation as apply_logo_xobject for consistency
                         # This ensures Page 0 widget matches Page 1+ overlay positions
                         
-                        pt_per_mm = 72.0 / 25.4
+                        pt_per_mm = MM_TO_POINTS
                         
                         # Get page dimensions in points
                         ph_pts = _page_h * pt_per_mm
@@ -2654,24 +2908,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
                         except NameError:
                             _placement = 'top-right'
                         
-                        if _placement == 'top-right':
-                            vis_x = pw_pts - mx - w_pt
-                            vis_y = my
-                        elif _placement == 'top-left':
-                            vis_x = mx
-                            vis_y = my
-                        elif _placement == 'bottom-right':
-                            vis_x = pw_pts - mx - w_pt
-                            vis_y = ph_pts - my - h_pt
-                        elif _placement == 'bottom-left':
-                            vis_x = mx
-                            vis_y = ph_pts - my - h_pt
-                        elif _placement == 'center':
-                            vis_x = (pw_pts - w_pt) / 2.0 + mx
-                            vis_y = (ph_pts - h_pt) / 2.0 + my
-                        else:
-                            vis_x = pw_pts - mx - w_pt
-                            vis_y = my
+                        vis_x, vis_y = placement_origin(pw_pts, ph_pts, w_pt, h_pt, mx, my, _placement)
                         
                         # Calculate center point (Visual coords, top-left origin)
                         cx = vis_x + w_pt / 2.0
@@ -2813,6 +3050,7 @@ def sign_cmd(args, add_logo_all_pages=True, use_xobject_opt=True, gui_logger=Non
 
 
 def build_cli_parser():
+    from constants import DEFAULT_DLL
     parser = argparse.ArgumentParser(description='pyHanko PKCS#11 PDF signer')
     parser.add_argument('--pkcs11-lib', default=str(DEFAULT_DLL), help='PKCS#11 module DLL path')
     sub = parser.add_subparsers(dest='cmd')